@@ -34,14 +34,17 @@ same project.
 
 from __future__ import absolute_import
 
+import json
 import logging
 from builtins import open
+from collections import OrderedDict
 from os.path import dirname, exists, join, pardir
 
 import click
 import click_log
 import pandas as pd
 from requests import get
+from six import iteritems
 
 LOGGER = logging.getLogger()
 click_log.basic_config(LOGGER)
@@ -129,8 +132,17 @@ def generate(mnx_dump):
     LOGGER.info("Generate the shortlist cross-references.")
     res = generate_shortlist(db, targets)
     LOGGER.info("Save result.")
-    res.to_json(join(dirname(__file__), pardir, "memote", "support", "data",
-                     "met_id_shortlist.json"), force_ascii=False)
+    # Store a compact form that omits namespaces without cross-references.
+    shortlist = OrderedDict(
+        (mnx_id, OrderedDict((namespace, xrefs)
+                             for namespace, xrefs in iteritems(column)
+                             if isinstance(xrefs, list) and len(xrefs) > 0))
+        for mnx_id, column in iteritems(res))
+    with open(join(dirname(__file__), pardir, "src", "memote", "support",
+                   "data", "met_id_shortlist.json"), "w",
+              encoding="utf-8") as file_handle:
+        json.dump(shortlist, file_handle, ensure_ascii=False,
+                  separators=(",", ":"))
 
 
 if __name__ == "__main__":
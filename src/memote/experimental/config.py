@@ -69,6 +69,7 @@ class ExperimentConfiguration(object):
         with open(filename) as file_h:
             self.config = yaml.load(file_h)
         self._base = dirname(filename)
+        self.processes = self.config.get("processes")
         self.media = dict()
         self.essentiality = dict()
         self.growth = dict()
@@ -142,6 +143,7 @@ class ExperimentConfiguration(object):
                 obj=exp,
                 filename=filename,
                 minimal_growth_rate=minimal_growth_rate,
+                processes=self.processes,
             )
             if experiment.medium is not None:
                 assert (
@@ -153,6 +155,16 @@ class ExperimentConfiguration(object):
             experiment.load()
             experiment.validate(model)
             self.essentiality[exp_id] = experiment
+        # Experiments under the same conditions share one deletion screen.
+        screens = dict()
+        for experiment in self.essentiality.values():
+            medium = None if experiment.medium is None else experiment.medium.id
+            screens.setdefault((medium, experiment.objective), set()).update(
+                experiment.data["gene"]
+            )
+        for experiment in self.essentiality.values():
+            medium = None if experiment.medium is None else experiment.medium.id
+            experiment.screen = tuple(sorted(screens[medium, experiment.objective]))
 
     def load_growth(self, model):
         """Load and validate all data files."""
@@ -23,15 +23,18 @@ import logging
 from typing import Optional
 
 import pandera as pa
+from cobra import Configuration
 from cobra.flux_analysis import single_gene_deletion
 from pandera.typing import Series
 
 from memote.experimental.experiment import Experiment
+from memote.support.cache import model_cache
 
 
 __all__ = ("EssentialityExperiment",)
 
 LOGGER = logging.getLogger(__name__)
+cobra_configuration = Configuration()
 
 
 class EssentialityExperimentModel(pa.DataFrameModel):
@@ -56,19 +59,67 @@ class EssentialityExperimentModel(pa.DataFrameModel):
         strict = "filter"
 
 
-class EssentialityExperiment(Experiment):
-    """Represent an essentiality experiment."""
+@model_cache
+def _delete_genes(model, genes, processes):
+    """
+    Return the growth rates of single gene deletion mutants.
+
+    Results are cached per model state such that experiments with the same
+    medium, objective, and genes share one deletion screen.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation in the experimental
+        conditions.
+    genes : tuple of str
+        The identifiers of the genes to delete.
+    processes : int
+        Number of processes to be used. It is passed as a keyword argument
+        and is therefore not part of the cache key.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The deletion results indexed by gene identifier.
 
-    def __init__(self, **kwargs):
+    """
+    result = single_gene_deletion(model, gene_list=list(genes), processes=processes)
+    result.index = [next(iter(ids)) for ids in result["ids"]]
+    return result
+
+
+class EssentialityExperiment(Experiment):
+    """
+    Represent an essentiality experiment.
+
+    Attributes
+    ----------
+    processes : int
+        Number of processes to be used for the gene deletions (the default is
+        taken from `cobra.Configuration.processes`).
+    screen : tuple of str
+        The identifiers of the genes to delete. By default these are the genes
+        of the experiment's data. Experiments under the same conditions that
+        share a screen compute their gene deletions only once.
+
+    """
+
+    def __init__(self, processes=None, **kwargs):
         """
         Initialize an essentiality experiment.
 
         Parameters
         ----------
+        processes : int, optional
+            Number of processes to be used for the gene deletions (the
+            default is taken from `cobra.Configuration.processes`).
         kwargs
 
         """
         super(EssentialityExperiment, self).__init__(**kwargs)
+        self.processes = processes
+        self.screen = None
 
     def validate(self, model, checks=None):
         """Use a defined schema to validate the essentiality table format."""
@@ -77,16 +128,21 @@ class EssentialityExperiment(Experiment):
 
     def evaluate(self, model):
         """Use the defined parameters to predict single gene essentiality."""
+        processes = self.processes
+        if processes is None:
+            processes = cobra_configuration.processes
+        screen = self.screen
+        if screen is None:
+            screen = tuple(self.data["gene"])
         with model:
             if self.medium is not None:
                 self.medium.apply(model)
             if self.objective is not None:
                 model.objective = self.objective
             model.add_cons_vars(self.constraints)
-            essen = single_gene_deletion(
-                model, gene_list=self.data["gene"], processes=1
-            )
-        essen["gene"] = [list(g)[0] for g in essen["ids"]]
+            deletions = _delete_genes(model, screen, processes=processes)
+        essen = deletions.loc[list(self.data["gene"])].reset_index(drop=True)
+        essen["gene"] = list(self.data["gene"])
         essen["essential"] = (essen["growth"] < self.minimal_growth_rate) | essen[
             "growth"
         ].isna()
@@ -148,6 +148,14 @@ def cli():
     callback=callbacks.validate_experimental,
     help="Define additional tests using experimental data.",
 )
+@click.option(
+    "--processes",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of processes to use in parallel computations, for example, "
+    "gene deletions. Takes precedence over the experimental configuration. "
+    "By default, all available CPUs are used.",
+)
 @click.option(
     "--custom-tests",
     type=click.Path(exists=True, file_okay=False),
@@ -184,6 +192,7 @@ def run(
     solver,
     solver_timeout,
     experimental,
+    processes,
     custom_tests,
     deployment,
     skip_unchanged,
@@ -236,6 +245,10 @@ def run(
     # Configure the chosen solver before attempting to load the model.
     config = cobra.Configuration()
     config.solver = solver
+    if processes is not None:
+        config.processes = processes
+        if experimental is not None:
+            experimental.processes = processes
 
     # Check if the model can be loaded at all.
     model, sbml_ver, notifications = api.validate_model(model)
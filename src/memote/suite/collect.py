@@ -25,6 +25,10 @@ import re
 import pytest
 
 from memote.suite.results.result import MemoteResult
+from memote.support.consistency import (
+    MetaboliteExchangePool,
+    detect_all_energy_generating_cycles,
+)
 from memote.support.helpers import find_biomass_reaction
 
 
@@ -176,6 +180,18 @@ class ResultCollectionPlugin(object):
         with self._model as model:
             yield model
 
+    @pytest.fixture(scope="session")
+    def exchange_pool(self):
+        """Provide worker processes that hold a pristine model copy."""
+        with MetaboliteExchangePool(self._model) as pool:
+            yield pool
+
+    @pytest.fixture(scope="session")
+    def energy_generating_cycles(self):
+        """Provide the erroneous energy-generating cycles of all couples."""
+        with self._model as model:
+            return detect_all_energy_generating_cycles(model)
+
     @pytest.fixture(scope="session")
     def sbml_version(self):
         """Provide SBML level, version, and FBC use."""
@@ -156,9 +156,8 @@ def test_metabolite_annotation_overview(model, db):
 
     """
     ann = test_metabolite_annotation_overview.annotation
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_overview(model.metabolites, db)
-    )
+    audit = annotation.generate_component_annotation_audit(model, "metabolites")
+    ann["data"][db] = audit.index[~audit["present", db]].tolist()
     ann["metric"][db] = len(ann["data"][db]) / len(model.metabolites)
     ann["message"][db] = wrapper.fill(
         """The following {} metabolites ({:.2%}) lack annotation for {}:
@@ -209,9 +208,8 @@ def test_reaction_annotation_overview(model, db):
 
     """
     ann = test_reaction_annotation_overview.annotation
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_overview(model.reactions, db)
-    )
+    audit = annotation.generate_component_annotation_audit(model, "reactions")
+    ann["data"][db] = audit.index[~audit["present", db]].tolist()
     ann["metric"][db] = len(ann["data"][db]) / len(model.reactions)
     ann["message"][db] = wrapper.fill(
         """The following {} reactions ({:.2%}) lack annotation for {}:
@@ -262,9 +260,8 @@ def test_gene_product_annotation_overview(model, db):
 
     """
     ann = test_gene_product_annotation_overview.annotation
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_overview(model.genes, db)
-    )
+    audit = annotation.generate_component_annotation_audit(model, "genes")
+    ann["data"][db] = audit.index[~audit["present", db]].tolist()
     ann["metric"][db] = len(ann["data"][db]) / len(model.genes)
     ann["message"][db] = wrapper.fill(
         """The following {} genes ({:.2%}) lack annotation for {}:
@@ -305,11 +302,8 @@ def test_metabolite_annotation_wrong_ids(model, db):
 
     """
     ann = test_metabolite_annotation_wrong_ids.annotation
-    ann["data"][db] = total = get_ids(
-        set(model.metabolites).difference(
-            annotation.generate_component_annotation_overview(model.metabolites, db)
-        )
-    )
+    audit = annotation.generate_component_annotation_audit(model, "metabolites")
+    ann["data"][db] = total = audit.index[audit["present", db]].tolist()
     ann["metric"][db] = 1.0
     ann["message"][db] = wrapper.fill(
         """There are no metabolite annotations for the {} database.
@@ -318,11 +312,7 @@ def test_metabolite_annotation_wrong_ids(model, db):
         )
     )
     assert len(total) > 0, ann["message"][db]
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_miriam_match(
-            model.metabolites, "metabolites", db
-        )
-    )
+    ann["data"][db] = audit.index[~audit["valid", db]].tolist()
     ann["metric"][db] = len(ann["data"][db]) / len(total)
     ann["message"][db] = wrapper.fill(
         """A total of {} metabolite annotations ({:.2%}) do not match the
@@ -364,11 +354,8 @@ def test_reaction_annotation_wrong_ids(model, db):
 
     """
     ann = test_reaction_annotation_wrong_ids.annotation
-    ann["data"][db] = total = get_ids(
-        set(model.reactions).difference(
-            annotation.generate_component_annotation_overview(model.reactions, db)
-        )
-    )
+    audit = annotation.generate_component_annotation_audit(model, "reactions")
+    ann["data"][db] = total = audit.index[audit["present", db]].tolist()
     ann["metric"][db] = 1.0
     ann["message"][db] = wrapper.fill(
         """There are no reaction annotations for the {} database.
@@ -377,11 +364,7 @@ def test_reaction_annotation_wrong_ids(model, db):
         )
     )
     assert len(total) > 0, ann["message"][db]
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_miriam_match(
-            model.reactions, "reactions", db
-        )
-    )
+    ann["data"][db] = audit.index[~audit["valid", db]].tolist()
     ann["metric"][db] = len(ann["data"][db]) / len(model.reactions)
     ann["message"][db] = wrapper.fill(
         """A total of {} reaction annotations ({:.2%}) do not match the
@@ -423,11 +406,8 @@ def test_gene_product_annotation_wrong_ids(model, db):
 
     """
     ann = test_gene_product_annotation_wrong_ids.annotation
-    ann["data"][db] = total = get_ids(
-        set(model.genes).difference(
-            annotation.generate_component_annotation_overview(model.genes, db)
-        )
-    )
+    audit = annotation.generate_component_annotation_audit(model, "genes")
+    ann["data"][db] = total = audit.index[audit["present", db]].tolist()
     ann["metric"][db] = 1.0
     ann["message"][db] = wrapper.fill(
         """There are no gene annotations for the {} database.
@@ -436,9 +416,7 @@ def test_gene_product_annotation_wrong_ids(model, db):
         )
     )
     assert len(total) > 0, ann["message"][db]
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_miriam_match(model.genes, "genes", db)
-    )
+    ann["data"][db] = audit.index[~audit["valid", db]].tolist()
     ann["metric"][db] = len(ann["data"][db]) / len(model.genes)
     ann["message"][db] = wrapper.fill(
         """A total of {} gene annotations ({:.2%}) do not match the
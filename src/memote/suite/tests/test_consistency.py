@@ -20,7 +20,6 @@
 from __future__ import absolute_import, division
 
 import pytest
-from cobra.flux_analysis import find_blocked_reactions
 
 import memote.support.consistency as consistency
 import memote.support.consistency_helpers as con_helpers
@@ -92,8 +91,8 @@ def test_inconsistent_min_stoichiometry(model):
     """
     Report inconsistent min stoichiometries.
 
-    Only 10 unconserved metabolites are reported and considered to
-    avoid computing for too long.
+    Only 10 unconserved metabolites are reported and considered, and the
+    search stops after five minutes, to avoid computing for too long.
 
     Implementation:
     Algorithm described in section 3.3 of
@@ -107,7 +106,9 @@ def test_inconsistent_min_stoichiometry(model):
     if not is_consistent:
         ann["data"] = [
             get_ids(mets)
-            for mets in consistency.find_inconsistent_min_stoichiometry(model)
+            for mets in consistency.find_inconsistent_min_stoichiometry(
+                model, time_limit=300
+            )
         ]
     ann["metric"] = len(ann["data"])
     ann["message"] = wrapper.fill(
@@ -127,7 +128,7 @@ def test_inconsistent_min_stoichiometry(model):
     message=dict(),
     metric=dict(),
 )
-def test_detect_energy_generating_cycles(model, met):
+def test_detect_energy_generating_cycles(model, met, energy_generating_cycles):
     """
     Expect that no energy metabolite can be produced out of nothing.
 
@@ -148,25 +149,28 @@ def test_detect_energy_generating_cycles(model, met):
 
     First attempt to identify the main compartment (cytosol), then attempt to
     identify each metabolite of the referenced list of energy couples via an
-    internal mapping table. Construct a dissipation reaction for each couple.
-    Carry out FBA with each dissipation reaction as the objective and report
-    those reactions that non-zero carry flux.
+    internal mapping table. Construct a dissipation reaction for each couple
+    and add all of them to the same model once. Carry out FBA with each
+    dissipation reaction in turn as the objective and report those reactions
+    that non-zero carry flux.
 
     """
     ann = test_detect_energy_generating_cycles.annotation
     # Test if the metabolite is present in the model.
-    main_comp = helpers.find_compartment_id_in_model(model, "c")
-    try:
-        helpers.find_met_in_model(model, met, main_comp)[0]
-    except ValueError:
-        pytest.skip("Metabolite {} is not in the MetaNetX shortlist.".format(met))
-    except (RuntimeError, IndexError):
+    if met not in energy_generating_cycles:
+        main_comp = helpers.find_compartment_id_in_model(model, "c")
+        try:
+            helpers.find_met_in_model(model, met, main_comp)[0]
+        except ValueError:
+            pytest.skip("Metabolite {} is not in the MetaNetX shortlist.".format(met))
+        except (RuntimeError, IndexError):
+            pass
         pytest.skip(
             "This test has been skipped since metabolite {} could "
             "not be found in the model.".format(met)
         )
-    # If the metabolite is present, carry out the test.
-    ann["data"][met] = consistency.detect_energy_generating_cycles(model, met)
+    # If the metabolite is present, report the result.
+    ann["data"][met] = energy_generating_cycles[met]
     # Report the number of cycles scaled by the number of reactions.
     ann["metric"][met] = len(ann["data"][met]) / len(model.reactions)
     ann["message"][met] = wrapper.fill(
@@ -261,16 +265,16 @@ def test_blocked_reactions(model):
     attributed to scope or knowledge gaps.
 
     Implementation:
-    Use flux variability analysis (FVA) implemented in
+    Open all exchange reactions, then maximize the fluxes of many reactions
+    at once in a fast consistency check (FASTCC) and remove the reactions
+    carrying flux from the candidates until no more candidates can carry
+    flux. Remaining reversible reactions are checked individually with flux
+    variability analysis (FVA). The result is the same as that of
     cobra.flux_analysis.find_blocked_reactions with open_exchanges=True.
-    Please refer to the cobrapy documentation for more information:
-    https://cobrapy.readthedocs.io/en/stable/autoapi/cobra/flux_analysis/
-    variability/index.html#cobra.flux_analysis.variability.
-    find_blocked_reactions
 
     """
     ann = test_blocked_reactions.annotation
-    ann["data"] = find_blocked_reactions(model, open_exchanges=True)
+    ann["data"] = consistency.find_universally_blocked_reactions(model)
     ann["metric"] = len(ann["data"]) / len(model.reactions)
     ann["message"] = wrapper.fill(
         """There are {} ({:.2%}) blocked reactions in
@@ -387,7 +391,7 @@ def test_find_disconnected(model):
 
 
 @annotate(title="Metabolite Production In Complete Medium", format_type="count")
-def test_find_metabolites_not_produced_with_open_bounds(model):
+def test_find_metabolites_not_produced_with_open_bounds(model, exchange_pool):
     """
     Expect metabolites to be producible in complete medium.
 
@@ -401,11 +405,16 @@ def test_find_metabolites_not_produced_with_open_bounds(model):
 
     Implementation:
     Open all model boundary reactions, then for each metabolite in the model
-    add a boundary reaction and maximize it with FBA.
+    add a boundary reaction and maximize it with FBA. Metabolites that no
+    reaction can produce within its bounds, or whose production is already
+    shown by a steady-state flux distribution of the boundary reactions, are
+    decided without solving their individual problem.
 
     """
     ann = test_find_metabolites_not_produced_with_open_bounds.annotation
-    ann["data"] = consistency.find_metabolites_not_produced_with_open_bounds(model)
+    ann["data"] = consistency.find_metabolites_not_produced_with_open_bounds(
+        model, pool=exchange_pool, prune=True
+    )
     ann["metric"] = len(ann["data"]) / len(model.metabolites)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) metabolites cannot be produced in complete
@@ -417,7 +426,7 @@ def test_find_metabolites_not_produced_with_open_bounds(model):
 
 
 @annotate(title="Metabolite Consumption In Complete Medium", format_type="count")
-def test_find_metabolites_not_consumed_with_open_bounds(model):
+def test_find_metabolites_not_consumed_with_open_bounds(model, exchange_pool):
     """
     Expect metabolites to be consumable in complete medium.
 
@@ -431,11 +440,16 @@ def test_find_metabolites_not_consumed_with_open_bounds(model):
 
     Implementation:
     Open all model boundary reactions, then for each metabolite in the model
-    add a boundary reaction and minimize it with FBA.
+    add a boundary reaction and minimize it with FBA. Metabolites that no
+    reaction can consume within its bounds, or whose consumption is already
+    shown by a steady-state flux distribution of the boundary reactions, are
+    decided without solving their individual problem.
 
     """
     ann = test_find_metabolites_not_consumed_with_open_bounds.annotation
-    ann["data"] = consistency.find_metabolites_not_consumed_with_open_bounds(model)
+    ann["data"] = consistency.find_metabolites_not_consumed_with_open_bounds(
+        model, pool=exchange_pool, prune=True
+    )
     ann["metric"] = len(ann["data"]) / len(model.metabolites)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) metabolites cannot be consumed in complete
@@ -68,11 +68,12 @@ def test_number_independent_conservation_relations(model):
     is system-specific.
 
     Implementation:
-    Calculate the left null space, i.e., the null space of the transposed
-    stoichiometric matrix, using an algorithm based on the singular value
-    decomposition adapted from
+    Estimate the rank of the stoichiometric matrix using an algorithm based on
+    the singular value decomposition adapted from
     https://scipy.github.io/old-wiki/pages/Cookbook/RankNullspace.html
-    Then, return the estimated dimension of that null space.
+    The dimension of the left null space, i.e., the null space of the
+    transposed stoichiometric matrix, is then the number of metabolites minus
+    that rank. The decomposition is shared with the other matrix tests.
 
     """
     ann = test_number_independent_conservation_relations.annotation
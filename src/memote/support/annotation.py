@@ -23,8 +23,12 @@ import logging
 import re
 from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 from future.utils import native_str
+from six import iteritems
+
+from memote.support.cache import model_cache
 
 
 LOGGER = logging.getLogger(__name__)
@@ -235,6 +239,72 @@ def generate_component_annotation_miriam_match(elements, component, db):
     return [elem for elem in elements if is_faulty(elem.annotation, db, pattern)]
 
 
+@model_cache
+def generate_component_annotation_audit(model, components):
+    """
+    Tabulate presence and conformity of all MIRIAM database annotations.
+
+    Each component's annotation is visited only once and each identifier is
+    matched only against the pattern of its own database.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        A cobrapy metabolic model.
+    components : {"metabolites", "reactions", "genes"}
+        A string denoting `cobra.Model` components.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The index of the table is given by the component identifiers. The
+        columns are grouped into "present" and "valid" and each group has one
+        column per MIRIAM database. A Boolean entry determines whether the
+        component is annotated with the database and whether all of those
+        annotations match its pattern, respectively. Missing annotations are
+        considered valid.
+
+    """
+    patterns = {
+        "metabolites": METABOLITE_ANNOTATIONS,
+        "reactions": REACTION_ANNOTATIONS,
+        "genes": GENE_PRODUCT_ANNOTATIONS,
+    }[components]
+    databases = list(patterns)
+    columns = {db: j for j, db in enumerate(databases)}
+    elements = getattr(model, components)
+    # Record the row and column coordinates of present and invalid entries.
+    present_at = ([], [])
+    invalid_at = ([], [])
+    for i, elem in enumerate(elements):
+        for db, value in iteritems(elem.annotation):
+            j = columns.get(db)
+            if j is None:
+                continue
+            present_at[0].append(i)
+            present_at[1].append(j)
+            match = patterns[db].match
+            if isinstance(value, native_str):
+                is_valid = match(value) is not None
+            else:
+                is_valid = all(match(term) is not None for term in value)
+            if not is_valid:
+                invalid_at[0].append(i)
+                invalid_at[1].append(j)
+    present = np.zeros((len(elements), len(databases)), dtype=bool)
+    present[present_at] = True
+    valid = np.ones_like(present)
+    valid[invalid_at] = False
+    index = [elem.id for elem in elements]
+    return pd.concat(
+        {
+            "present": pd.DataFrame(present, index=index, columns=databases),
+            "valid": pd.DataFrame(valid, index=index, columns=databases),
+        },
+        axis=1,
+    )
+
+
 def generate_component_id_namespace_overview(model, components):
     """
     Tabulate which MIRIAM databases the component's identifier matches.
@@ -259,27 +329,21 @@ def generate_component_id_namespace_overview(model, components):
         "reactions": REACTION_ANNOTATIONS,
         "genes": GENE_PRODUCT_ANNOTATIONS,
     }[components]
-    databases = list(patterns)
-    data = list()
-    index = list()
-    for elem in getattr(model, components):
-        index.append(elem.id)
-        data.append(tuple(patterns[db].match(elem.id) is not None for db in databases))
-    df = pd.DataFrame(data, index=index, columns=databases)
+    identifiers = pd.Series(
+        [elem.id for elem in getattr(model, components)], dtype=object
+    )
+    df = pd.DataFrame(
+        {
+            db: identifiers.str.match(pattern, na=False).astype(bool)
+            for db, pattern in iteritems(patterns)
+        },
+        columns=list(patterns),
+    )
+    df.index = identifiers.values
     if components != "genes":
         # Clean up of the dataframe. Unfortunately the Biocyc patterns match
         # broadly. Hence, whenever a Metabolite or Reaction ID matches to any
         # DB pattern AND the Biocyc pattern we have to assume that this is a
         # false positive.
-        # First determine all rows in which 'biocyc' and other entries are
-        # True simultaneously and use this Boolean series to create another
-        # column temporarily.
-        df["duplicate"] = df[df["biocyc"]].sum(axis=1) >= 2
-        # Replace all nan values with False
-        df["duplicate"].fillna(False, inplace=True)
-        # Use the additional column to index the original dataframe to identify
-        # false positive biocyc hits and set them to False.
-        df.loc[df["duplicate"], "biocyc"] = False
-        # Delete the additional column
-        del df["duplicate"]
+        df["biocyc"] &= ~df.drop(columns="biocyc").any(axis=1)
     return df
@@ -20,13 +20,15 @@
 from __future__ import absolute_import, division
 
 import logging
+from collections import defaultdict
 from itertools import combinations
 
 from cobra.medium import find_external_compartment
-from pylru import lrudecorator
+from six import iteritems, itervalues
 
 import memote.support.helpers as helpers
-from memote.support.gpr_helpers import find_top_level_complex
+from memote.support.cache import model_cache
+from memote.support.gpr_helpers import compile_gpr
 from memote.utils import filter_none
 
 
@@ -122,16 +124,14 @@ def find_ngam(model):
     atp_adp_conv_rxns = helpers.find_converting_reactions(model, ("MNXM3", "MNXM7"))
     id_of_main_compartment = helpers.find_compartment_id_in_model(model, "c")
 
-    reactants = {
-        helpers.find_met_in_model(model, "MNXM3", id_of_main_compartment)[0],
-        helpers.find_met_in_model(model, "MNXM2", id_of_main_compartment)[0],
-    }
-
-    products = {
-        helpers.find_met_in_model(model, "MNXM7", id_of_main_compartment)[0],
-        helpers.find_met_in_model(model, "MNXM1", id_of_main_compartment)[0],
-        helpers.find_met_in_model(model, "MNXM9", id_of_main_compartment)[0],
-    }
+    atp, h2o, adp, h, pi = (
+        mets[0]
+        for mets in helpers.find_mets_in_model(
+            model, ["MNXM3", "MNXM2", "MNXM7", "MNXM1", "MNXM9"], id_of_main_compartment
+        )
+    )
+    reactants = {atp, h2o}
+    products = {adp, h, pi}
 
     candidates = [
         rxn
@@ -226,13 +226,12 @@ def find_protein_complexes(model):
     for rxn in model.reactions:
         if not rxn.gene_reaction_rule:
             continue
-        size = find_top_level_complex(rxn.gene_reaction_rule)
-        if size >= 2:
+        if compile_gpr(rxn.gene_reaction_rule).complex_size >= 2:
             complexes.append(rxn)
     return complexes
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_pure_metabolic_reactions(model):
     """
     Return reactions that are neither transporters, exchanges, nor pseudo.
@@ -283,7 +282,14 @@ def find_unique_metabolites(model):
     return unique
 
 
-@lrudecorator(size=2)
+def _hashable(value):
+    """Return an annotation value in a form that can be used as a key."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+@model_cache
 def find_duplicate_metabolites_in_compartments(model):
     """
     Return list of metabolites with duplicates in the same compartment.
@@ -305,15 +311,22 @@ def find_duplicate_metabolites_in_compartments(model):
 
     """
     unique_identifiers = ["inchikey", "inchi"]
-    duplicates = []
-    for met_1, met_2 in combinations(model.metabolites, 2):
-        if met_1.compartment == met_2.compartment:
-            for key in unique_identifiers:
-                if key in met_1.annotation and key in met_2.annotation:
-                    if met_1.annotation[key] == met_2.annotation[key]:
-                        duplicates.append((met_1.id, met_2.id))
-                        break
-    return duplicates
+    # Group the metabolites by compartment and structure annotation in a
+    # single pass. Any two metabolites that share a group are duplicates.
+    groups = defaultdict(list)
+    for index, met in enumerate(model.metabolites):
+        for key in unique_identifiers:
+            if key in met.annotation:
+                groups[(met.compartment, key, _hashable(met.annotation[key]))].append(
+                    index
+                )
+    pairs = set()
+    for indexes in itervalues(groups):
+        pairs.update(combinations(indexes, 2))
+    # Report the pairs in the order of the model's metabolites.
+    return [
+        (model.metabolites[i].id, model.metabolites[j].id) for i, j in sorted(pairs)
+    ]
 
 
 def find_reactions_with_partially_identical_annotations(model):
@@ -351,9 +364,9 @@ def find_reactions_with_partially_identical_annotations(model):
         "biocyc",
         "bigg.reaction",
     ]
-    # Build a list that associates a reaction with a set of its annotations.
-    ann_rxns = []
-    for rxn in model.reactions:
+    # Group the reactions by their set of annotations.
+    ann_rxns = {}
+    for index, rxn in enumerate(model.reactions):
         ann = []
         for key in rxn_db_identifiers:
             if key in rxn.annotation:
@@ -361,29 +374,64 @@ def find_reactions_with_partially_identical_annotations(model):
                     ann.extend([(key, elem) for elem in rxn.annotation[key]])
                 else:
                     ann.append((key, rxn.annotation[key]))
-        ann_rxns.append((rxn, frozenset(ann)))
-    # Compute the intersection between annotations and record the matching
-    # reaction identifiers.
-    for (rxn_a, ann_a), (rxn_b, ann_b) in combinations(ann_rxns, 2):
-        mutual_pair = tuple(ann_a & ann_b)
-        if len(mutual_pair) > 0:
-            duplicates.setdefault(mutual_pair, set()).update([rxn_a.id, rxn_b.id])
+        if len(ann) > 0:
+            ann_rxns.setdefault(frozenset(ann), []).append(index)
+    annotations = list(ann_rxns)
+    # Build an inverted index from single annotations to the sets containing
+    # them such that only sets which share an annotation are intersected.
+    inverted = defaultdict(list)
+    for set_index, ann in enumerate(annotations):
+        for item in ann:
+            inverted[item].append(set_index)
+    candidates = set()
+    for set_indexes in itervalues(inverted):
+        candidates.update(combinations(set_indexes, 2))
+    # Record the reactions sharing annotations together with the first pair of
+    # reactions that share them which determines the order of the result.
+    for ann, indexes in iteritems(ann_rxns):
+        if len(indexes) > 1:
+            duplicates[ann] = ((indexes[0], indexes[1]), set(indexes))
+    for set_a, set_b in candidates:
+        mutual = annotations[set_a] & annotations[set_b]
+        indexes_a = ann_rxns[annotations[set_a]]
+        indexes_b = ann_rxns[annotations[set_b]]
+        first = (indexes_a[0], indexes_b[0])
+        if mutual in duplicates:
+            previous, members = duplicates[mutual]
+            first = min(previous, first)
+        else:
+            members = set()
+        duplicates[mutual] = (first, members)
+        members.update(indexes_a)
+        members.update(indexes_b)
     # Transform the object for JSON compatibility
     num_duplicated = set()
     duplicated = {}
-    for key in duplicates:
+    for key, (_, members) in sorted(iteritems(duplicates), key=lambda i: i[1][0]):
         # Object keys must be strings in JSON.
         new_key = ",".join(sorted("{}:{}".format(ns, term) for ns, term in key))
-        duplicated[new_key] = rxns = list(duplicates[key])
+        duplicated[new_key] = rxns = [model.reactions[i].id for i in sorted(members)]
         num_duplicated.update(rxns)
     return duplicated, len(num_duplicated)
 
 
+def _find_root(forest, node):
+    """Return the representative of a node in a disjoint-set forest."""
+    while forest[node] != node:
+        # Halve the path to the root for faster subsequent look-ups.
+        forest[node] = forest[forest[node]]
+        node = forest[node]
+    return node
+
+
 def map_metabolites_to_structures(metabolites, compartments):
     """
     Map metabolites from the identifier namespace to structural space.
 
     Metabolites who lack structural annotation (InChI or InChIKey) are ignored.
+    Metabolites in the same compartment that share any structure identifier are
+    mapped to the same structure, transitively, such that a metabolite with two
+    identifiers joins the structures of both.
 
     Parameters
     ----------
@@ -402,31 +450,40 @@ def map_metabolites_to_structures(metabolites, compartments):
     """
     # TODO (Moritz Beber): Consider SMILES?
     unique_identifiers = ["inchikey", "inchi"]
-    met2mol = {}
-    molecules = {c: [] for c in compartments}
+    # A disjoint-set forest of structure identifiers per compartment.
+    forests = {c: {} for c in compartments}
+    met2ann = []
     for met in metabolites:
         ann = []
         for key in unique_identifiers:
             mol = met.annotation.get(key)
-            if mol is not None:
+            if isinstance(mol, list):
+                ann.extend(mol)
+            elif mol is not None:
                 ann.append(mol)
         # Ignore metabolites without the required information.
         if len(ann) == 0:
             continue
-        ann = set(ann)
-        # Compare with other structures in the same compartment.
-        mols = molecules[met.compartment]
-        for i, mol_group in enumerate(mols):
-            if len(ann & mol_group) > 0:
-                mol_group.update(ann)
-                # We map to the index of the group because it is hashable and
-                # cheaper to compare later.
-                met2mol[met] = "{}-{}".format(met.compartment, i)
-                break
-        if met not in met2mol:
-            # The length of the list corresponds to the 0-index after appending.
-            met2mol[met] = "{}-{}".format(met.compartment, len(mols))
-            mols.append(ann)
+        # Join the structures of all identifiers in the same compartment.
+        forest = forests[met.compartment]
+        for mol in ann:
+            forest.setdefault(mol, mol)
+        root = _find_root(forest, ann[0])
+        for mol in ann[1:]:
+            other = _find_root(forest, mol)
+            if other != root:
+                forest[other] = root
+        met2ann.append((met, ann[0]))
+    # We map to the index of the group because it is hashable and cheaper to
+    # compare later. Groups are numbered in the order of their first metabolite.
+    met2mol = {}
+    groups = {c: {} for c in compartments}
+    for met, mol in met2ann:
+        root = _find_root(forests[met.compartment], mol)
+        indexes = groups[met.compartment]
+        met2mol[met] = "{}-{}".format(
+            met.compartment, indexes.setdefault(root, len(indexes))
+        )
     return met2mol
 
 
@@ -439,11 +496,11 @@ def find_duplicate_reactions(model):
     the same compartment.
 
     This can be useful to curate merged models or to clean-up bulk model
-    modifications. The heuristic compares reactions in a pairwise manner.
-    For each reaction, the metabolite annotations are checked for a description
-    of the structure (via InChI and InChIKey).If they exist, substrates and
-    products as well as the stoichiometries of any reaction pair are compared.
-    Only reactions where the substrates, products, stoichiometry and
+    modifications. For each reaction, the metabolite annotations are checked
+    for a description of the structure (via InChI and InChIKey). If they exist,
+    reactions are grouped by their substrates and products with their
+    stoichiometries in structure space and by their reversibility. Only
+    reactions where the substrates, products, stoichiometry and
     reversibility are identical are considered to be duplicates.
     This test will not be able to identify duplicate reactions if there are no
     structure annotations. Further, it will report reactions with
@@ -463,10 +520,9 @@ def find_duplicate_reactions(model):
 
     """
     met2mol = map_metabolites_to_structures(model.metabolites, model.compartments)
-    # Build a list associating reactions with their stoichiometry in molecular
-    # structure space.
-    structural = []
-    for rxn in model.reactions:
+    # Group reactions by their stoichiometry in molecular structure space.
+    groups = defaultdict(list)
+    for index, rxn in enumerate(model.reactions):
         # Ignore reactions that have metabolites without structures.
         if not all(met in met2mol for met in rxn.metabolites):
             continue
@@ -474,22 +530,23 @@ def find_duplicate_reactions(model):
         # the InChI for H2O and OH is the same.
         substrates = {met2mol[met]: rxn.get_coefficient(met) for met in rxn.reactants}
         products = {met2mol[met]: rxn.get_coefficient(met) for met in rxn.products}
-        structural.append((rxn, substrates, products))
-    # Compare reactions using their structure-based stoichiometries.
-    num_duplicated = set()
-    duplicates = []
-    for (rxn_a, sub_a, prod_a), (rxn_b, sub_b, prod_b) in combinations(structural, 2):
-        # Compare the substrates.
-        if sub_a != sub_b:
-            continue
-        # Compare the products.
-        if prod_a != prod_b:
-            continue
-        # Compare whether they are both (ir-)reversible.
-        if rxn_a.reversibility != rxn_b.reversibility:
-            continue
         # TODO (Moritz Beber): We could compare bounds here but it might be
         #  worth knowing about the reactions even if their bounds differ?
+        signature = (
+            frozenset(iteritems(substrates)),
+            frozenset(iteritems(products)),
+            rxn.reversibility,
+        )
+        groups[signature].append(index)
+    # Any two reactions with the same signature are duplicates.
+    pairs = []
+    for indexes in itervalues(groups):
+        pairs.extend(combinations(indexes, 2))
+    num_duplicated = set()
+    duplicates = []
+    for i, j in sorted(pairs):
+        rxn_a = model.reactions[i]
+        rxn_b = model.reactions[j]
         duplicates.append((rxn_a.id, rxn_b.id))
         num_duplicated.add(rxn_a.id)
         num_duplicated.add(rxn_b.id)
@@ -504,9 +561,9 @@ def find_reactions_with_identical_genes(model):
     two reactions have the same genes.
     This can be useful to curate merged models or to clean-up bulk model
     modifications, but also to identify promiscuous enzymes.
-    The heuristic compares reactions in a pairwise manner and reports on
-    reaction pairs whose genes are identical. Reactions with missing genes are
-    skipped.
+    The heuristic groups reactions by their set of genes and reports on
+    groups of reactions whose genes are identical. Reactions with missing
+    genes are skipped.
 
     Parameters
     ----------
@@ -524,20 +581,20 @@ def find_reactions_with_identical_genes(model):
 
     """
     duplicates = dict()
-    for rxn_a, rxn_b in combinations(model.reactions, 2):
-        if not (rxn_a.genes and rxn_b.genes):
+    for rxn in model.reactions:
+        if not rxn.genes:
             continue
-        if rxn_a.genes == rxn_b.genes:
-            # This works because the `genes` are frozen sets.
-            identifiers = rxn_a.genes
-            duplicates.setdefault(identifiers, set()).update([rxn_a.id, rxn_b.id])
+        # This works because the `genes` are frozen sets.
+        duplicates.setdefault(rxn.genes, []).append(rxn.id)
     # Transform the object for JSON compatibility
     num_duplicated = set()
     duplicated = {}
-    for key in duplicates:
+    for key, rxns in iteritems(duplicates):
+        if len(rxns) < 2:
+            continue
         # Object keys must be strings in JSON.
         new_key = ",".join(sorted(g.id for g in key))
-        duplicated[new_key] = rxns = list(duplicates[key])
+        duplicated[new_key] = rxns
         num_duplicated.update(rxns)
     return duplicated, len(num_duplicated)
 
@@ -210,17 +210,18 @@ def gam_in_biomass(model, reaction):
     id_of_main_compartment = helpers.find_compartment_id_in_model(model, "c")
 
     try:
-        left = {
-            helpers.find_met_in_model(model, "MNXM3", id_of_main_compartment)[0],
-            helpers.find_met_in_model(model, "MNXM2", id_of_main_compartment)[0],
-        }
-        right = {
-            helpers.find_met_in_model(model, "MNXM7", id_of_main_compartment)[0],
-            helpers.find_met_in_model(model, "MNXM1", id_of_main_compartment)[0],
-            helpers.find_met_in_model(model, "MNXM9", id_of_main_compartment)[0],
-        }
+        atp, h2o, adp, h, pi = (
+            mets[0]
+            for mets in helpers.find_mets_in_model(
+                model,
+                ["MNXM3", "MNXM2", "MNXM7", "MNXM1", "MNXM9"],
+                id_of_main_compartment,
+            )
+        )
     except RuntimeError:
         return False
+    left = {atp, h2o}
+    right = {adp, h, pi}
 
     return left.issubset(set(reaction.reactants)) and right.issubset(
         set(reaction.products)
@@ -435,10 +436,10 @@ def bundle_biomass_components(model, reaction):
     gam_mets = ["MNXM3", "MNXM2", "MNXM7", "MNXM1", "MNXM9"]
     try:
         gam = set(
-            [
-                helpers.find_met_in_model(model, met, id_of_main_compartment)[0]
-                for met in gam_mets
-            ]
+            mets[0]
+            for mets in helpers.find_mets_in_model(
+                model, gam_mets, id_of_main_compartment
+            )
         )
     except RuntimeError:
         gam = set()
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache analysis results per model and model version."""
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sqlite3
+import weakref
+from collections import namedtuple
+from functools import wraps
+from operator import attrgetter
+from os.path import dirname, expanduser, join
+
+from pylru import lrucache
+
+
+__all__ = (
+    "model_version",
+    "ModelCache",
+    "MODEL_CACHE",
+    "model_cache",
+    "user_cache_dir",
+    "DiskCache",
+)
+
+LOGGER = logging.getLogger(__name__)
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "models", "versions"])
+
+
+_REACTION_ATTRIBUTES = attrgetter(
+    "id", "name", "lower_bound", "upper_bound", "gene_reaction_rule", "annotation"
+)
+_METABOLITE_ATTRIBUTES = attrgetter(
+    "id", "name", "compartment", "formula", "charge", "annotation"
+)
+_GENE_ATTRIBUTES = attrgetter("id", "name", "functional", "annotation")
+_get_metabolites = attrgetter("metabolites")
+
+
+def _digest(data):
+    """Return a digest of a nested structure of built-in values."""
+    try:
+        serialized = marshal.dumps(data)
+    except ValueError:
+        # Annotations may hold values that cannot be marshalled.
+        serialized = repr(data).encode("utf-8")
+    return hashlib.sha1(serialized).hexdigest()
+
+
+def model_version(model):
+    """
+    Return a stamp of the current state of a model.
+
+    The stamp covers everything that the cached analyses read: the reactions
+    with their bounds, stoichiometry, gene-protein-reaction rules, names, and
+    annotations, the metabolites with their compartments, formulas, charges,
+    names, and annotations, the genes with their names, functional states,
+    and annotations, the compartments, and the objective. Any change to them,
+    including changes made in place or within a model context, which are
+    reverted on exit, thus results in a different stamp.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    str
+        A stamp that compares equal for equal model states.
+
+    """
+    return _digest(
+        (
+            list(map(_REACTION_ATTRIBUTES, model.reactions)),
+            [
+                ([met.id for met in stoichiometry], list(stoichiometry.values()))
+                for stoichiometry in map(_get_metabolites, model.reactions)
+            ],
+            list(map(_METABOLITE_ATTRIBUTES, model.metabolites)),
+            list(map(_GENE_ATTRIBUTES, model.genes)),
+            model.compartments,
+            model.objective.direction,
+            str(model.objective.expression),
+        )
+    )
+
+
+class ModelCache(object):
+    """
+    Store the results of analyses per model and model version.
+
+    Results are kept for as long as their model exists and for the few most
+    recently seen versions of each model, such that leaving a model context
+    makes previously computed results available again.
+
+    Attributes
+    ----------
+    hits : int
+        The number of results that were found in the cache.
+    misses : int
+        The number of results that had to be computed.
+
+    """
+
+    def __init__(self, max_versions=4, **kwargs):
+        """
+        Initialize an empty cache.
+
+        Parameters
+        ----------
+        max_versions : int, optional
+            The number of versions per model whose results are kept
+            (default 4).
+
+        """
+        super(ModelCache, self).__init__(**kwargs)
+        self._max_versions = max_versions
+        self._models = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model, key, compute):
+        """
+        Return a cached result or compute and store it.
+
+        Parameters
+        ----------
+        model : cobra.Model
+            The metabolic model under investigation.
+        key : hashable
+            Identifies the analysis and its arguments.
+        compute : callable
+            Computes the result when called without arguments.
+
+        """
+        versions = self._models.get(model)
+        if versions is None:
+            versions = self._models[model] = lrucache(self._max_versions)
+        version = model_version(model)
+        if version in versions:
+            results = versions[version]
+        else:
+            results = versions[version] = dict()
+        if key in results:
+            self.hits += 1
+            return results[key]
+        self.misses += 1
+        result = results[key] = compute()
+        return result
+
+    def evict(self, model=None):
+        """
+        Remove the results of one or all models.
+
+        Parameters
+        ----------
+        model : cobra.Model, optional
+            The model whose results are removed (default all models).
+
+        """
+        if model is None:
+            self._models.clear()
+        else:
+            self._models.pop(model, None)
+
+    def info(self):
+        """Return the hit and miss counts and the number of cached states."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            len(self._models),
+            sum(len(versions) for versions in self._models.values()),
+        )
+
+
+MODEL_CACHE = ModelCache()
+
+
+def model_cache(func):
+    """
+    Cache the results of a function of a model in `MODEL_CACHE`.
+
+    The decorated function must take the model as its first positional
+    argument. Any further positional arguments must be hashable and are part
+    of the key under which the result is cached. Keyword arguments are passed
+    on but are not part of the key. They are meant for options that change
+    how a result is computed but not the result itself, such as the number of
+    processes.
+
+    """
+
+    @wraps(func)
+    def wrapper(model, *args, **kwargs):
+        return MODEL_CACHE.get(
+            model,
+            (func.__module__, func.__name__) + args,
+            lambda: func(model, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+def user_cache_dir():
+    """
+    Return the directory for memote's persistent caches.
+
+    The directory is given by the environment variable ``MEMOTE_CACHE_DIR``
+    or else is the directory ``memote`` in ``XDG_CACHE_HOME`` which defaults
+    to ``~/.cache``.
+
+    """
+    path = os.environ.get("MEMOTE_CACHE_DIR")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or join(expanduser("~"), ".cache")
+    return join(base, "memote")
+
+
+class DiskCache(object):
+    """
+    Store JSON serializable values under string keys in a SQLite database.
+
+    The cache can be used as a context manager which closes the database
+    connection on exit.
+
+    """
+
+    def __init__(self, path, **kwargs):
+        """
+        Open or create a cache.
+
+        Parameters
+        ----------
+        path : str
+            The path of the SQLite database file. Missing directories are
+            created.
+
+        """
+        super(DiskCache, self).__init__(**kwargs)
+        if dirname(path):
+            os.makedirs(dirname(path), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=60)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def __enter__(self):
+        """Return the cache itself."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the database connection."""
+        self.close()
+
+    def get_many(self, keys):
+        """
+        Return the stored values of those keys that are in the cache.
+
+        Parameters
+        ----------
+        keys : iterable of str
+            The keys to look up.
+
+        Returns
+        -------
+        dict
+            A mapping from the found keys to their values.
+
+        """
+        keys = list(keys)
+        result = {}
+        # Stay below SQLite's limit on the number of query parameters.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            cursor = self._connection.execute(
+                "SELECT key, value FROM cache WHERE key IN ({})".format(
+                    ", ".join("?" * len(chunk))
+                ),
+                chunk,
+            )
+            result.update((key, json.loads(value)) for key, value in cursor)
+        return result
+
+    def set_many(self, items):
+        """
+        Store several values at once.
+
+        Parameters
+        ----------
+        items : dict
+            A mapping from keys to JSON serializable values.
+
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in items.items()],
+            )
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
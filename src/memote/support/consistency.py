@@ -19,10 +19,15 @@
 
 import logging
 import multiprocessing
+import time
+from collections import defaultdict
+from functools import partial
 from operator import attrgetter
 
 import numpy as np
+import pandas as pd
 from cobra import Configuration, Reaction
+from cobra.core.solution import get_solution
 from cobra.exceptions import Infeasible
 from cobra.flux_analysis import flux_variability_analysis
 from optlang.interface import INFEASIBLE, OPTIMAL
@@ -30,6 +35,7 @@ from optlang.symbolics import Zero
 
 import memote.support.consistency_helpers as con_helpers
 import memote.support.helpers as helpers
+from memote.support.cache import model_version
 
 
 LOGGER = logging.getLogger(__name__)
@@ -184,7 +190,135 @@ def find_unconserved_metabolites(model):
         )
 
 
-def find_inconsistent_min_stoichiometry(model, atol=1e-13, max_mets_computed=10):
+def _optimize_before(problem, deadline):
+    """
+    Optimize the problem unless the deadline has passed.
+
+    Parameters
+    ----------
+    problem : optlang.Model
+        Specific optlang interface Model instance.
+    deadline : float or None
+        Wall-clock time (in seconds since the epoch) after which no more
+        optimization is started. The solver's time limit is set to the
+        remaining time.
+
+    Returns
+    -------
+    str or None
+        The solver status or None if the deadline has passed.
+
+    """
+    if deadline is not None:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        problem.configuration.timeout = max(int(remaining), 1)
+    return problem.optimize()
+
+
+def _enumerate_minimal_sets(problem, indicators, metabolite_id, Constraint, deadline):
+    """
+    Enumerate the minimal unconservable sets that contain a metabolite.
+
+    Parameters
+    ----------
+    problem : optlang.Model
+        The MILP created by `con_helpers.create_milp_problem`.
+    indicators : list
+        The binary indicator `optlang.Variable`s of that problem.
+    metabolite_id : str
+        The identifier of an unconserved metabolite.
+    Constraint : optlang.Constraint
+        Constraint class for a specific optlang interface.
+    deadline : float or None
+        Wall-clock time after which no more sets are computed.
+
+    Returns
+    -------
+    list
+        The minimal sets as tuples of metabolite identifiers.
+
+    """
+    minimal_sets = []
+    cuts = []
+    # expect a positive mass for the unconserved metabolite
+    problem.variables[metabolite_id].lb = 1e-3
+    status = _optimize_before(problem, deadline)
+    while status == OPTIMAL:
+        LOGGER.debug("%s: status %s", metabolite_id, status)
+        solution = tuple(var.name[2:] for var in indicators if var.primal > 0.2)
+        LOGGER.debug("%s: set size %d", metabolite_id, len(solution))
+        minimal_sets.append(solution)
+        if len(solution) == 1:
+            break
+        cuts.append(
+            con_helpers.add_cut(problem, indicators, len(solution) - 1, Constraint)
+        )
+        status = _optimize_before(problem, deadline)
+    LOGGER.debug("%s: last status %s", metabolite_id, status)
+    # reset
+    problem.variables[metabolite_id].lb = 0.0
+    problem.remove(cuts)
+    return minimal_sets
+
+
+def _init_milp_worker(problem, indicator_names, Constraint, deadline):
+    """
+    Initialize a global MILP copy for multiprocessing.
+
+    Parameters
+    ----------
+    problem : optlang.Model
+        The MILP created by `con_helpers.create_milp_problem`.
+    indicator_names : list
+        The names of the binary indicator variables.
+    Constraint : optlang.Constraint
+        Constraint class for a specific optlang interface.
+    deadline : float or None
+        Wall-clock time after which no more sets are computed.
+
+    """
+    global _milp
+    global _indicators
+    global _constraint_class
+    global _deadline
+    _milp = problem
+    _indicators = [problem.variables[name] for name in indicator_names]
+    _constraint_class = Constraint
+    _deadline = deadline
+
+
+def _solve_minimal_sets(metabolite_id):
+    """
+    Enumerate the minimal unconservable sets of a metabolite in a worker.
+
+    Notes
+    -----
+    The MILP, its indicators, constraint class, and deadline are globals.
+
+    Parameters
+    ----------
+    metabolite_id : str
+        The identifier of an unconserved metabolite.
+
+    Returns
+    -------
+    list
+        The minimal sets as tuples of metabolite identifiers.
+    str
+        The identifier of the considered metabolite.
+
+    """
+    minimal_sets = _enumerate_minimal_sets(
+        _milp, _indicators, metabolite_id, _constraint_class, _deadline
+    )
+    return minimal_sets, metabolite_id
+
+
+def find_inconsistent_min_stoichiometry(
+    model, atol=1e-13, max_mets_computed=10, time_limit=None, processes=None
+):
     """
     Detect inconsistent minimal net stoichiometries.
 
@@ -197,7 +331,15 @@ def find_inconsistent_min_stoichiometry(model, atol=1e-13, max_mets_computed=10)
         very small but larger than zero.
     max_mets_computed: int, optional
         To avoid computing for too long, a soft cap is added to the number of
-        computed unconserved metabolites (trivial cases are ignored).
+        computed minimal sets (trivial cases are ignored). Use None in order to
+        rely on the `time_limit` only.
+    time_limit : float, optional
+        A wall-clock budget in seconds. Once it is exhausted, the sets that
+        were found so far are returned (the default is no limit).
+    processes: int, optional
+        Number of processes to be used (the default is taken from
+        `cobra.Configuration.processes`). Each process solves its own copy of
+        the MILP for a share of the unconserved metabolites.
 
     Notes
     -----
@@ -211,6 +353,7 @@ def find_inconsistent_min_stoichiometry(model, atol=1e-13, max_mets_computed=10)
            Bioinformatics 24, no. 19 (2008): 2245.
 
     """
+    deadline = None if time_limit is None else time.time() + time_limit
     if check_stoichiometric_consistency(model):
         return set()
     Model, Constraint, Variable, Objective = con_helpers.get_interface(model)
@@ -221,13 +364,28 @@ def find_inconsistent_min_stoichiometry(model, atol=1e-13, max_mets_computed=10)
     get_id = attrgetter("id")
     reactions = sorted(internal_rxns, key=get_id)
     metabolites = sorted(internal_mets, key=get_id)
-    stoich, met_index, rxn_index = con_helpers.stoichiometry_matrix(
+    stoich, met_index, rxn_index = con_helpers.sparse_stoichiometry_matrix(
         metabolites, reactions
     )
     left_ns = con_helpers.nullspace(stoich.T, atol)
     if left_ns.size == 0:
         LOGGER.info("Left nullspace is empty!")
         return {(met,) for met in unconserved_mets}
+    inc_minimal = set()
+    candidates = []
+    # Sort the candidates such that the reported sets do not depend on the
+    # iteration order of the set of metabolites.
+    for met in sorted(unconserved_mets, key=get_id):
+        # always add the met as an uncoserved set if there is no left nullspace
+        row = met_index[met]
+        if (left_ns[row] == 0.0).all():
+            LOGGER.debug("%s: singleton minimal unconservable set.", met.id)
+            # singleton set!
+            inc_minimal.add((met.id,))
+        else:
+            candidates.append(met.id)
+    if len(candidates) == 0:
+        return {(model.metabolites.get_by_id(met_id),) for (met_id,) in inc_minimal}
     (problem, indicators) = con_helpers.create_milp_problem(
         left_ns, metabolites, Model, Variable, Constraint, Objective
     )
@@ -238,51 +396,49 @@ def find_inconsistent_min_stoichiometry(model, atol=1e-13, max_mets_computed=10)
     )
     LOGGER.info("Left nullspace has a dimension of %d.", left_ns.shape[1])
     LOGGER.debug("%s", str(problem))
-    inc_minimal = set()
-    cuts = list()
+    if max_mets_computed is None:
+        max_mets_computed = float("inf")
+    if processes is None:
+        processes = cobra_configuration.processes
+    processes = min(processes, len(candidates))
     n_computed = 0
-    for met in unconserved_mets:
-        # always add the met as an uncoserved set if there is no left nullspace
-        row = met_index[met]
-        if (left_ns[row] == 0.0).all():
-            LOGGER.debug("%s: singleton minimal unconservable set.", met.id)
-            # singleton set!
-            inc_minimal.add((met,))
-            continue
-        if n_computed >= max_mets_computed:
-            LOGGER.debug("max number of computed unconserved metabolites reached")
-            break
-        # expect a positive mass for the unconserved metabolite
-        problem.variables[met.id].lb = 1e-3
-        status = problem.optimize()
-        while status == "optimal":
-            LOGGER.debug("%s: status %s", met.id, status)
-            LOGGER.debug(
-                "sum of all primal values: %f", sum(problem.primal_values.values())
-            )
-            LOGGER.debug(
-                "sum of binary indicators: %f", sum(var.primal for var in indicators)
-            )
-            solution = [
-                model.metabolites.get_by_id(var.name[2:])
-                for var in indicators
-                if var.primal > 0.2
-            ]
-            LOGGER.debug("%s: set size %d", met.id, len(solution))
-            n_computed += 1
-            inc_minimal.add(tuple(solution))
-            if len(solution) == 1:
+
+    if processes > 1:
+        pool = multiprocessing.Pool(
+            processes,
+            initializer=_init_milp_worker,
+            initargs=(problem, [var.name for var in indicators], Constraint, deadline),
+        )
+        try:
+            # Results are collected in submission order such that the cap on
+            # computed sets selects the same sets as the sequential search.
+            for minimal_sets, _ in pool.imap(_solve_minimal_sets, candidates):
+                n_computed += len(minimal_sets)
+                inc_minimal.update(minimal_sets)
+                if n_computed >= max_mets_computed:
+                    LOGGER.debug(
+                        "max number of computed unconserved metabolites reached"
+                    )
+                    break
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        for met_id in candidates:
+            if n_computed >= max_mets_computed:
+                LOGGER.debug("max number of computed unconserved metabolites reached")
                 break
-            cuts.append(
-                con_helpers.add_cut(problem, indicators, len(solution) - 1, Constraint)
+            minimal_sets = _enumerate_minimal_sets(
+                problem, indicators, met_id, Constraint, deadline
             )
-            status = problem.optimize()
-        LOGGER.debug("%s: last status %s", met.id, status)
-        # reset
-        problem.variables[met.id].lb = 0.0
-        problem.remove(cuts)
-        cuts.clear()
-    return inc_minimal
+            n_computed += len(minimal_sets)
+            inc_minimal.update(minimal_sets)
+    if deadline is not None and time.time() >= deadline:
+        LOGGER.info("Time limit reached while computing minimal unconservable sets.")
+    return {
+        tuple(model.metabolites.get_by_id(met_id) for met_id in mets)
+        for mets in inc_minimal
+    }
 
 
 def find_elementary_leakage_modes(model, atol=1e-13):
@@ -354,9 +510,38 @@ def detect_energy_generating_cycles(model, metabolite_id):
 
     """
     main_comp = helpers.find_compartment_id_in_model(model, "c")
+    dissipation_rxn = _build_dissipation_reaction(
+        model, metabolite_id, main_comp, "Dissipation"
+    )
+    helpers.close_boundaries_sensibly(model)
+    model.add_reactions([dissipation_rxn])
+    return _find_cycle_reactions(model, dissipation_rxn)
+
+
+def _build_dissipation_reaction(model, metabolite_id, main_comp, reaction_id):
+    """
+    Build the dissipation reaction of an energy metabolite.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    metabolite_id : str
+        The identifier of an energy metabolite.
+    main_comp : str
+        The identifier of the main compartment (cytosol) in the model.
+    reaction_id : str
+        The identifier of the new reaction.
+
+    Returns
+    -------
+    cobra.Reaction
+        The dissipation reaction which is not yet part of the model.
+
+    """
     met = helpers.find_met_in_model(model, metabolite_id, main_comp)[0]
 
-    dissipation_rxn = Reaction("Dissipation")
+    dissipation_rxn = Reaction(reaction_id)
     if metabolite_id in ["MNXM3", "MNXM63", "MNXM51", "MNXM121", "MNXM423"]:
         # build nucleotide-type dissipation reaction
         dissipation_rxn.add_metabolites(
@@ -406,21 +591,156 @@ def detect_energy_generating_cycles(model, metabolite_id):
     )[0]
 
     dissipation_rxn.add_metabolites({met: -1, dissipation_product: 1})
-    helpers.close_boundaries_sensibly(model)
-    model.add_reactions([dissipation_rxn])
+    return dissipation_rxn
+
+
+def _find_cycle_reactions(model, dissipation_rxn):
+    """Return the reactions carrying flux when maximizing the dissipation."""
     model.objective = dissipation_rxn
     solution = model.optimize(raise_error=True)
 
     if solution.objective_value > 0.0:
         return (
             solution.fluxes[solution.fluxes.abs() > 0.0]
-            .index.drop(["Dissipation"])
+            .index.drop([dissipation_rxn.id])
             .tolist()
         )
     else:
         return []
 
 
+def detect_all_energy_generating_cycles(model, metabolite_ids=None):
+    """
+    Detect erroneous energy-generating cycles for many metabolites at once.
+
+    The dissipation reactions of all energy metabolites are added to the same
+    model with closed exchanges. Each of them is then maximized in turn while
+    the others are prevented from carrying flux. The result for each
+    metabolite is the same as that of `detect_energy_generating_cycles`.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    metabolite_ids : iterable, optional
+        The identifiers of energy metabolites (default all of
+        `ENERGY_COUPLES`).
+
+    Returns
+    -------
+    dict
+        A map from energy metabolite identifiers to the list of reactions that
+        are involved in erroneous energy-generating cycles. Metabolites that
+        could not be found in the model are missing.
+
+    """
+    if metabolite_ids is None:
+        metabolite_ids = list(ENERGY_COUPLES)
+    with model:
+        main_comp = helpers.find_compartment_id_in_model(model, "c")
+        dissipation_rxns = {}
+        for metabolite_id in metabolite_ids:
+            try:
+                dissipation_rxns[metabolite_id] = _build_dissipation_reaction(
+                    model, metabolite_id, main_comp, "Dissipation_" + metabolite_id
+                )
+            except (ValueError, RuntimeError, IndexError) as err:
+                LOGGER.debug("Skipping energy metabolite '%s': %s", metabolite_id, err)
+        helpers.close_boundaries_sensibly(model)
+        model.add_reactions(list(dissipation_rxns.values()))
+        bounds = {rxn.id: rxn.bounds for rxn in dissipation_rxns.values()}
+        for rxn in dissipation_rxns.values():
+            rxn.bounds = 0, 0
+        result = {}
+        for metabolite_id, rxn in dissipation_rxns.items():
+            rxn.bounds = bounds[rxn.id]
+            result[metabolite_id] = _find_cycle_reactions(model, rxn)
+            rxn.bounds = 0, 0
+    return result
+
+
+def _reaction_stoichiometry(reactions):
+    """
+    Return the stoichiometry of the reactions and their metabolites.
+
+    Returns
+    -------
+    scipy.sparse.csc_matrix
+        The stoichiometric matrix.
+    scipy.sparse.csc_matrix
+        The matrix indicating which metabolites participate in which reaction
+        even with a zero coefficient.
+    list
+        The metabolites in row order.
+
+    """
+    metabolites = list(
+        dict.fromkeys(met for rxn in reactions for met in rxn.metabolites)
+    )
+    s_matrix, _, _ = con_helpers.sparse_stoichiometry_matrix(metabolites, reactions)
+    participation = s_matrix.copy()
+    participation.data = np.ones_like(participation.data)
+    return s_matrix, participation, metabolites
+
+
+def find_mass_imbalance(reactions):
+    """
+    Return the imbalance of each element in each reaction.
+
+    The elemental composition of all metabolites is multiplied with the
+    stoichiometric matrix of the reactions in one step.
+
+    Parameters
+    ----------
+    reactions : iterable
+        An iterable of cobra.Reaction's.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The net amount of each element (columns) produced by each reaction
+        (rows). Rows of reactions with a metabolite of unknown composition are
+        NaN.
+
+    """
+    reactions = list(reactions)
+    s_matrix, participation, metabolites = _reaction_stoichiometry(reactions)
+    composition, elements, known = con_helpers.element_composition_matrix(metabolites)
+    imbalance = pd.DataFrame(
+        (s_matrix.T @ composition).toarray(),
+        index=[rxn.id for rxn in reactions],
+        columns=elements,
+    )
+    incomplete = (participation.T @ (~known).astype(float)) > 0
+    imbalance.loc[incomplete, :] = np.nan
+    return imbalance[sorted(elements)]
+
+
+def find_charge_imbalance(reactions):
+    """
+    Return the charge imbalance of each reaction.
+
+    Parameters
+    ----------
+    reactions : iterable
+        An iterable of cobra.Reaction's.
+
+    Returns
+    -------
+    pandas.Series
+        The net charge produced by each reaction. It is NaN for reactions with a
+        metabolite of unknown charge.
+
+    """
+    reactions = list(reactions)
+    s_matrix, participation, metabolites = _reaction_stoichiometry(reactions)
+    charges, known = con_helpers.charge_vector(metabolites)
+    imbalance = pd.Series(s_matrix.T @ charges, index=[rxn.id for rxn in reactions])
+    incomplete = (participation.T @ (~known).astype(float)) > 0
+    imbalance[incomplete] = np.nan
+    return imbalance
+
+
 def find_mass_unbalanced_reactions(reactions):
     """
     Find metabolic reactions that are not mass balanced.
@@ -431,7 +751,10 @@ def find_mass_unbalanced_reactions(reactions):
         An iterable of cobra.Reaction's.
 
     """
-    return [rxn for rxn in reactions if not con_helpers.is_mass_balanced(rxn)]
+    reactions = list(reactions)
+    # Missing values are unequal to zero, too.
+    unbalanced = (find_mass_imbalance(reactions) != 0).any(axis=1)
+    return [rxn for rxn, is_unbalanced in zip(reactions, unbalanced) if is_unbalanced]
 
 
 def find_charge_unbalanced_reactions(reactions):
@@ -444,7 +767,9 @@ def find_charge_unbalanced_reactions(reactions):
         An iterable of cobra.Reaction's.
 
     """
-    return [rxn for rxn in reactions if not con_helpers.is_charge_balanced(rxn)]
+    reactions = list(reactions)
+    unbalanced = find_charge_imbalance(reactions) != 0
+    return [rxn for rxn, is_unbalanced in zip(reactions, unbalanced) if is_unbalanced]
 
 
 def find_stoichiometrically_balanced_cycles(model):
@@ -474,13 +799,176 @@ def find_stoichiometrically_balanced_cycles(model):
 
     """
     helpers.close_boundaries_sensibly(model)
-    fva_result = flux_variability_analysis(model, loopless=False)
+    fva_result = con_helpers.flux_variability(model, loopless=False)
     return fva_result.index[
         (fva_result["minimum"] <= (-1 + TOLERANCE_THRESHOLD))
         | (fva_result["maximum"] >= (1 - TOLERANCE_THRESHOLD))
     ].tolist()
 
 
+def _find_flux_carrying(model, candidates, direction, epsilon):
+    """
+    Return reactions that carry flux while maximizing many of them at once.
+
+    Each candidate reaction's flux in the given direction, capped at epsilon,
+    contributes to the objective (LP7 in [1]_). A solution thus tends to
+    activate as many candidates as possible, but any reaction carrying flux
+    is reported.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    candidates : list
+        The cobra.Reaction's whose flux is maximized.
+    direction : int
+        Maximize the forward flux with 1 and the reverse flux with -1.
+    epsilon : float
+        The flux above which a reaction no longer contributes.
+
+    Returns
+    -------
+    set or None
+        The identifiers of reactions carrying flux or None if the optimum is
+        below the model's tolerance, that is, if none of the candidates can
+        carry flux in the given direction.
+
+    References
+    ----------
+    .. [1] Vlassis, N., Pacheco, M. P., & Sauter, T. (2014). Fast
+           reconstruction of compact context-specific metabolic network
+           models. PLoS Computational Biology, 10(1), e1003424.
+           http://doi.org/10.1371/journal.pcbi.1003424
+
+    """
+    problem = model.problem
+    with model:
+        indicators = [
+            problem.Variable("__flux_{}".format(rxn.id), lb=0, ub=epsilon)
+            for rxn in candidates
+        ]
+        caps = [
+            problem.Constraint(Zero, ub=0, name="__cap_{}".format(rxn.id))
+            for rxn in candidates
+        ]
+        model.add_cons_vars(indicators + caps)
+        model.solver.update()
+        for rxn, indicator, cap in zip(candidates, indicators, caps):
+            cap.set_linear_coefficients(
+                {
+                    indicator: 1.0,
+                    rxn.forward_variable: -direction,
+                    rxn.reverse_variable: direction,
+                }
+            )
+        model.objective = problem.Objective(Zero, direction="max", sloppy=True)
+        model.objective.set_linear_coefficients({var: 1.0 for var in indicators})
+        optimum = model.slim_optimize()
+        if np.isnan(optimum):
+            raise Infeasible(
+                "It was not possible to find flux-carrying reactions. Make "
+                "sure that the model can be solved!"
+            )
+        if optimum < model.tolerance:
+            return None
+        fluxes = get_solution(model).fluxes
+    return set(fluxes.index[fluxes.abs() >= model.tolerance])
+
+
+def find_universally_blocked_reactions(model, open_exchanges=True, epsilon=1.0):
+    """
+    Return reactions that cannot carry any flux.
+
+    Rather than running flux variability analysis with two problems per
+    reaction, the fluxes of all remaining candidate reactions that can only
+    proceed in one direction are maximized at once (FASTCC [1]_). Every
+    reaction that carries flux in a solution is removed from the candidates
+    and the problem is solved again until none of them can carry flux. The
+    number of problems solved thus grows with the number of network layers
+    rather than the number of reactions. Reversible reactions are activated
+    in the same way, one direction at a time, but since that excludes the
+    other direction, the remaining ones are finally checked individually. The
+    result is the same as that of `cobra.flux_analysis.find_blocked_reactions`.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    open_exchanges : bool, optional
+        Whether to open all exchange reactions to at least -1000 and 1000
+        (default True).
+    epsilon : float, optional
+        The flux above which a reaction no longer contributes to the objective
+        (default 1).
+
+    Returns
+    -------
+    list
+        The identifiers of reactions that cannot carry flux above the model's
+        tolerance.
+
+    References
+    ----------
+    .. [1] Vlassis, N., Pacheco, M. P., & Sauter, T. (2014). Fast
+           reconstruction of compact context-specific metabolic network
+           models. PLoS Computational Biology, 10(1), e1003424.
+           http://doi.org/10.1371/journal.pcbi.1003424
+
+    """
+    # Each stage is defined by the direction of flux and whether a vanishing
+    # optimum proves that all of its candidates are blocked.
+    stages = [
+        (1, True, lambda rxn: rxn.lower_bound >= 0 < rxn.upper_bound),
+        (-1, True, lambda rxn: rxn.lower_bound < 0 >= rxn.upper_bound),
+        (1, False, lambda rxn: rxn.lower_bound < 0 < rxn.upper_bound),
+        (-1, False, lambda rxn: rxn.lower_bound < 0 < rxn.upper_bound),
+    ]
+    with model:
+        if open_exchanges:
+            for rxn in model.exchanges:
+                rxn.bounds = (
+                    min(rxn.lower_bound, -1000),
+                    max(rxn.upper_bound, 1000),
+                )
+        candidates = {rxn.id for rxn in model.reactions}
+        unresolved = set()
+        num_problems = 0
+        for direction, is_exact, is_active in stages:
+            while True:
+                active = [
+                    rxn
+                    for rxn in model.reactions
+                    if rxn.id in candidates and is_active(rxn)
+                ]
+                if len(active) == 0:
+                    break
+                unblocked = _find_flux_carrying(model, active, direction, epsilon)
+                num_problems += 1
+                if unblocked is not None:
+                    unblocked &= candidates
+                if unblocked is None and is_exact:
+                    break
+                elif not unblocked:
+                    unresolved.update(rxn.id for rxn in active)
+                    break
+                candidates -= unblocked
+        unresolved &= candidates
+        if len(unresolved) > 0:
+            fva_result = flux_variability_analysis(
+                model, reaction_list=sorted(unresolved), fraction_of_optimum=0.0
+            )
+            num_problems += 2 * len(unresolved)
+            candidates -= set(
+                fva_result.index[fva_result.abs().max(axis=1) >= model.tolerance]
+            )
+        LOGGER.info(
+            "Found %d blocked reactions by solving %d problems.",
+            len(candidates),
+            num_problems,
+        )
+    return [rxn.id for rxn in model.reactions if rxn.id in candidates]
+
+
 def find_orphans(model):
     """
     Return metabolites that are only consumed in reactions.
@@ -544,7 +1032,7 @@ def find_disconnected(model):
     return [met for met in model.metabolites if len(met.reactions) == 0]
 
 
-def _init_worker(model, variable_name, coefficient):
+def _init_worker(model, variable_name):
     """
     Initialize a global model object for multiprocessing.
 
@@ -554,22 +1042,16 @@ def _init_worker(model, variable_name, coefficient):
         The metabolic model under investigation.
     variable_name: str
         The name of the variable representing the metabolite exchange.
-    coefficient: int
-        The value of the metabolite's stoichiometric coefficient: -1 to test
-        if the model can produce the metabolite and 1 to test if it can be
-        consumed.
 
     """
     global _model
     global _sink
-    global _coefficient
     _model = model
     _sink = model.variables[variable_name]
     _model.objective = _sink
-    _coefficient = coefficient
 
 
-def _solve_metabolite_exchange(metabolite_id):
+def _solve_metabolite_exchange(metabolite_id, coefficient):
     """
     Solve for a metabolite's exchange flux.
 
@@ -579,12 +1061,16 @@ def _solve_metabolite_exchange(metabolite_id):
 
     Notes
     -----
-    The model, exchange variable, and stoichiometric coefficient are globals.
+    The model and exchange variable are globals.
 
     Parameters
     ----------
     metabolite_id: str
         The exchange will be added to this metabolite as a linear coefficient.
+    coefficient: int
+        The value of the metabolite's stoichiometric coefficient: -1 to test
+        if the model can produce the metabolite and 1 to test if it can be
+        consumed.
 
     Returns
     -------
@@ -595,19 +1081,29 @@ def _solve_metabolite_exchange(metabolite_id):
         The identifier of the considered metabolite.
 
     """
-    global _model
-    global _sink
-    global _coefficient
     constraint = _model.constraints[metabolite_id]
-    constraint.set_linear_coefficients({_sink: _coefficient})
+    constraint.set_linear_coefficients({_sink: coefficient})
     solution = _model.slim_optimize()
     constraint.set_linear_coefficients({_sink: 0})
     return solution, metabolite_id
 
 
-def find_blocked_metabolites(model, coefficient, processes=None):
+def _add_exchange_sink(model):
+    """Open all exchanges and add the metabolite exchange variable."""
+    helpers.open_exchanges(model)
+    sink = model.problem.Variable("__multi_sink", lb=0, ub=1000)
+    model.add_cons_vars([sink])
+    model.solver.update()
+    return sink
+
+
+def _find_structurally_blocked(model, coefficient):
     """
-    Return metabolite identifiers that cannot be produced or consumed.
+    Return metabolites that the reaction bounds prevent from being exchanged.
+
+    A metabolite cannot be produced if no reaction is able to produce it
+    within its bounds and likewise for consumption. Such metabolites are
+    blocked without having to solve any problem.
 
     Parameters
     ----------
@@ -615,56 +1111,492 @@ def find_blocked_metabolites(model, coefficient, processes=None):
         The metabolic model under investigation.
     coefficient: int
         Test if production is possible with -1 and consumption with 1.
-    processes: int, optional
-        Number of processes to be used (the default is taken from
-        `cobra.Configuration.processes`).
 
     Returns
     -------
-    list
+    set
         The identifiers of blocked metabolites.
 
     """
-    if processes is None:
-        processes = cobra_configuration.processes
-    met_identifiers = [m.id for m in model.metabolites]
-    num_mets = len(met_identifiers)
-    processes = min(processes, num_mets)
 
-    with model:
-        helpers.open_exchanges(model)
-        sink = model.problem.Variable("__multi_sink", lb=0, ub=1000)
-        model.add_cons_vars([sink])
-        model.solver.update()
+    def can_contribute(rxn, met):
+        # The net flux of the metabolite that would have to be exchanged has
+        # the opposite sign of the exchange coefficient.
+        if -coefficient * rxn.get_coefficient(met) > 0:
+            return rxn.upper_bound > 0
+        else:
+            return rxn.lower_bound < 0
 
-        if processes > 1:
-            chunk_size = num_mets // processes
-            pool = multiprocessing.Pool(
-                processes,
-                initializer=_init_worker,
-                initargs=(model, sink.name, coefficient),
-            )
-            result_iter = pool.imap_unordered(
-                _solve_metabolite_exchange, met_identifiers, chunksize=chunk_size
+    return {
+        met.id
+        for met in model.metabolites
+        if not any(can_contribute(rxn, met) for rxn in met.reactions)
+    }
+
+
+def _find_seed_flux_distribution(model):
+    """
+    Return a steady-state flux distribution.
+
+    The flux distribution is the average of the solutions minimizing and
+    maximizing the total boundary flux. By convexity it is a feasible steady
+    state that tends to keep fluxes away from their bounds.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    pandas.Series or None
+        The reaction fluxes or None if no steady state was found.
+
+    """
+    boundary = [rxn for rxn in model.reactions if len(rxn.metabolites) == 1]
+    if len(boundary) == 0:
+        return None
+    model.objective = {rxn: 1 for rxn in boundary}
+    seeds = []
+    for direction in ("min", "max"):
+        model.objective_direction = direction
+        if np.isnan(model.slim_optimize()):
+            return None
+        seeds.append(get_solution(model).fluxes)
+    return (seeds[0] + seeds[1]) / 2
+
+
+def _find_reaction_exchanges(model, fluxes, threshold):
+    """
+    Return the net metabolite exchanges of changing single reaction fluxes.
+
+    Increasing or decreasing the flux of one reaction of a steady state within
+    its bounds produces and consumes exactly the metabolites of that reaction.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    fluxes : pandas.Series
+        A steady-state flux distribution.
+    threshold : float
+        Flux changes smaller than this are ignored.
+
+    Returns
+    -------
+    list
+        Dictionaries that map metabolite identifiers to their net production
+        (positive) or consumption (negative).
+
+    """
+    exchanges = []
+    for rxn in model.reactions:
+        flux = fluxes[rxn.id]
+        for sign, room in ((1, rxn.upper_bound - flux), (-1, flux - rxn.lower_bound)):
+            change = sign * min(room, 1.0)
+            if abs(change) < threshold:
+                continue
+            exchanges.append(
+                {met.id: change * coef for met, coef in rxn.metabolites.items()}
             )
-            pool.close()
-            blocked = [
-                met_id
-                for solution, met_id in result_iter
-                if np.isnan(solution) or solution < model.tolerance
-            ]
-            pool.join()
-        else:
-            _init_worker(model, sink.name, coefficient)
-            blocked = [
+    return exchanges
+
+
+class _ExchangeProof(object):
+    """
+    Prove the production and consumption of metabolites from net exchanges.
+
+    A feasible net exchange may produce and consume several metabolites at
+    once. If each metabolite that it consumes can be produced on its own and
+    each one that it produces can be consumed on its own, mixing the exchange
+    with those leaves a single metabolite that is produced or consumed. The
+    same holds if exactly one metabolite lacks such a witness, which is then
+    proven. Every proven metabolite is a witness for the other exchanges in
+    turn, such that the proofs propagate through the network.
+
+    Attributes
+    ----------
+    threshold : float
+        The smallest amount of a metabolite that counts as produced or
+        consumed.
+    witnesses : dict
+        The amount by which a metabolite can be produced or consumed on its own
+        keyed by its identifier and the direction, 1 for production and -1 for
+        consumption.
+
+    """
+
+    def __init__(self, threshold, **kwargs):
+        """
+        Start without any exchanges.
+
+        Parameters
+        ----------
+        threshold : float
+            The smallest amount of a metabolite that counts as produced or
+            consumed.
+
+        """
+        super(_ExchangeProof, self).__init__(**kwargs)
+        self.threshold = threshold
+        self.witnesses = dict()
+        self._exchanges = list()
+        self._index = defaultdict(list)
+
+    def count(self, met_id):
+        """Return the number of exchanges involving the metabolite."""
+        return len(self._index[met_id])
+
+    def add(self, exchange):
+        """
+        Add a feasible net exchange and propagate what it proves.
+
+        Parameters
+        ----------
+        exchange : dict
+            A map of metabolite identifiers to their net production (positive)
+            or consumption (negative).
+
+        Returns
+        -------
+        int
+            The number of newly proven metabolite directions.
+
+        """
+        self._exchanges.append(exchange)
+        for met_id in exchange:
+            self._index[met_id].append(len(self._exchanges) - 1)
+        return self._propagate([len(self._exchanges) - 1])
+
+    def _propagate(self, queue):
+        """Check the queued exchanges for proofs until no new ones appear."""
+        num_proven = 0
+        while len(queue) > 0:
+            exchange = self._exchanges[queue.pop()]
+            # Each metabolite needs a witness for the opposite direction.
+            weights = {
+                met_id: abs(amount) / self.witnesses[(met_id, -np.sign(amount))]
+                for met_id, amount in exchange.items()
+                if (met_id, -np.sign(amount)) in self.witnesses
+            }
+            missing = [met_id for met_id in exchange if met_id not in weights]
+            if len(missing) > 1:
+                continue
+            total = sum(weights.values())
+            for met_id in missing or exchange:
+                amount = exchange[met_id]
+                key = (met_id, np.sign(amount))
+                if key in self.witnesses:
+                    continue
+                # The convex combination with the witnesses of all other
+                # metabolites leaves this amount of the metabolite.
+                proven = abs(amount) / (1.0 + total - weights.get(met_id, 0.0))
+                if proven < self.threshold:
+                    continue
+                self.witnesses[key] = proven
+                num_proven += 1
+                queue.extend(self._index[met_id])
+        return num_proven
+
+
+def _prove_jointly(model, proof, direction):
+    """
+    Prove the production or consumption of many metabolites at once.
+
+    Each metabolite receives a capped sink and source that exchange no more
+    than its witnesses allow for. Every solution is thus a net exchange that
+    the proof accepts. Maximizing the number of exchanged metabolites is
+    repeated until no new metabolites are proven.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation with open exchanges.
+    proof : _ExchangeProof
+        The proof to extend.
+    direction : int
+        Prove production with 1 and consumption with -1.
+
+    """
+    prob = model.problem
+    sinks = {
+        met.id: prob.Variable("__sink_" + met.id, lb=0, ub=0)
+        for met in model.metabolites
+    }
+    sources = {
+        met.id: prob.Variable("__source_" + met.id, lb=0, ub=0)
+        for met in model.metabolites
+    }
+    targets = {
+        met.id: prob.Variable("__target_" + met.id, lb=0, ub=0)
+        for met in model.metabolites
+    }
+    exchange = sinks if direction > 0 else sources
+    constraints = [
+        prob.Constraint(
+            targets[met_id] - exchange[met_id], ub=0, name="__target_" + met_id
+        )
+        for met_id in targets
+    ]
+    model.add_cons_vars(
+        list(sinks.values())
+        + list(sources.values())
+        + list(targets.values())
+        + constraints
+    )
+    model.solver.update()
+    for met in model.metabolites:
+        model.constraints[met.id].set_linear_coefficients(
+            {sinks[met.id]: -1, sources[met.id]: 1}
+        )
+    model.objective = prob.Objective(Zero, direction="max", sloppy=True)
+    model.objective.set_linear_coefficients({var: 1 for var in targets.values()})
+    num_proven = 1
+    while num_proven > 0:
+        num_targets = 0
+        for met_id in targets:
+            sinks[met_id].ub = proof.witnesses.get((met_id, -1), 0)
+            sources[met_id].ub = proof.witnesses.get((met_id, 1), 0)
+            if (met_id, direction) in proof.witnesses or exchange[met_id].ub == 0:
+                targets[met_id].ub = 0
+            else:
+                targets[met_id].ub = 1
+                num_targets += 1
+        if num_targets == 0:
+            break
+        value = model.slim_optimize()
+        if np.isnan(value) or value < proof.threshold:
+            break
+        num_proven = proof.add(
+            {
+                met_id: sinks[met_id].primal - sources[met_id].primal
+                for met_id in targets
+                if abs(sinks[met_id].primal - sources[met_id].primal) > model.tolerance
+            }
+        )
+        LOGGER.debug("A joint exchange proved %d metabolites.", num_proven)
+
+
+class MetaboliteExchangePool(object):
+    """
+    Test the production and consumption of metabolites with open exchanges.
+
+    The worker processes receive a copy of the model once, when the pool is
+    created, and then solve any number of metabolite exchange problems. A pool
+    can thus be shared by all tests of a session. Changes to the model after
+    the creation of the pool are not seen by its workers.
+
+    Attributes
+    ----------
+    processes : int
+        The number of worker processes. With a single process, all problems
+        are solved in the current process instead.
+
+    """
+
+    def __init__(self, model, processes=None, **kwargs):
+        """
+        Start the worker processes.
+
+        Parameters
+        ----------
+        model : cobra.Model
+            The metabolic model under investigation.
+        processes: int, optional
+            Number of processes to be used (the default is taken from
+            `cobra.Configuration.processes`).
+
+        """
+        super(MetaboliteExchangePool, self).__init__(**kwargs)
+        if processes is None:
+            processes = cobra_configuration.processes
+        self._model = model
+        self._met_identifiers = [m.id for m in model.metabolites]
+        self._tolerance = model.tolerance
+        self.processes = max(min(processes, len(self._met_identifiers)), 1)
+        self._pool = None
+        self._proof = None
+        self._proof_version = None
+        if self.processes > 1:
+            with model:
+                sink = _add_exchange_sink(model)
+                self._pool = multiprocessing.Pool(
+                    self.processes,
+                    initializer=_init_worker,
+                    initargs=(model, sink.name),
+                )
+
+    def __enter__(self):
+        """Return the pool itself as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Shut down the worker processes."""
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _extend_proof(self, model, version, direction):
+        """
+        Return the proof of metabolite exchanges for the current model.
+
+        The proof is kept for as long as the model is unchanged such that the
+        production and consumption tests build on each other's results.
+
+        """
+        if self._proof is None or self._proof_version != version:
+            # We require a wide margin over the solver tolerance.
+            self._proof = _ExchangeProof(1e4 * self._tolerance)
+            self._proof_version = version
+            fluxes = _find_seed_flux_distribution(model)
+            if fluxes is not None:
+                for exchange in _find_reaction_exchanges(
+                    model, fluxes, self._proof.threshold
+                ):
+                    self._proof.add(exchange)
+        with model:
+            _prove_jointly(model, self._proof, direction)
+        return self._proof
+
+    def _solve_unproven(self, solve, met_identifiers, proof, direction):
+        """Solve exchange problems in batches until all are decided."""
+        results = []
+        while len(met_identifiers) > 0:
+            batch = met_identifiers[: self.processes]
+            if self._pool is None:
+                batch_results = list(map(solve, batch))
+            else:
+                batch_results = self._pool.map(solve, batch)
+            for solution, met_id in batch_results:
+                if solution >= proof.threshold:
+                    proof.add({met_id: direction * solution})
+            results.extend(batch_results)
+            met_identifiers = [
                 met_id
-                for solution, met_id in map(_solve_metabolite_exchange, met_identifiers)
-                if np.isnan(solution) or solution < model.tolerance
+                for met_id in met_identifiers[self.processes :]
+                if (met_id, direction) not in proof.witnesses
             ]
-    return sorted(blocked)
+        return results
+
+    def find_blocked(self, coefficient, prune=False):
+        """
+        Return metabolite identifiers that cannot be produced or consumed.
+
+        Parameters
+        ----------
+        coefficient: int
+            Test if production is possible with -1 and consumption with 1.
+        prune : bool, optional
+            Whether to skip metabolites whose result can be proven without
+            solving their exchange problem (default False). The result is the
+            same either way.
+
+        Returns
+        -------
+        list
+            The identifiers of blocked metabolites.
+
+        Notes
+        -----
+        When pruning, metabolites that no reaction can produce (or consume)
+        within its bounds are blocked. Single reaction flux changes of a steady
+        state and a few joint problems with capped sinks and sources on all
+        metabolites then prove many metabolites to be unblocked
+        (``_ExchangeProof``). The remaining problems are solved one batch at a
+        time, most connected metabolites first, and each solution is used to
+        prove further metabolites. Only blocked metabolites and those that
+        cannot be proven otherwise thus require their own problem.
+
+        """
+        solve = partial(_solve_metabolite_exchange, coefficient=coefficient)
+        direction = -coefficient
+        with self._model as model:
+            version = model_version(model) if prune else None
+            sink = _add_exchange_sink(model)
+            if prune:
+                blocked = _find_structurally_blocked(model, coefficient)
+                proof = self._extend_proof(model, version, direction)
+                met_identifiers = sorted(
+                    (
+                        met_id
+                        for met_id in self._met_identifiers
+                        if met_id not in blocked
+                        and (met_id, direction) not in proof.witnesses
+                    ),
+                    key=proof.count,
+                    reverse=True,
+                )
+                LOGGER.info(
+                    "Pruned %d blocked and %d unblocked metabolites.",
+                    len(blocked),
+                    len(self._met_identifiers) - len(blocked) - len(met_identifiers),
+                )
+            else:
+                blocked = set()
+                met_identifiers = self._met_identifiers
+            if self._pool is None:
+                _init_worker(model, sink.name)
+            if prune:
+                results = self._solve_unproven(solve, met_identifiers, proof, direction)
+            elif self._pool is None:
+                results = list(map(solve, met_identifiers))
+            else:
+                chunk_size = max(len(met_identifiers) // self.processes, 1)
+                results = list(
+                    self._pool.imap_unordered(
+                        solve, met_identifiers, chunksize=chunk_size
+                    )
+                )
+        blocked.update(
+            met_id
+            for solution, met_id in results
+            if np.isnan(solution) or solution < self._tolerance
+        )
+        return sorted(blocked)
 
 
-def find_metabolites_not_produced_with_open_bounds(model, processes=None):
+def find_blocked_metabolites(
+    model, coefficient, processes=None, pool=None, prune=False
+):
+    """
+    Return metabolite identifiers that cannot be produced or consumed.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    coefficient: int
+        Test if production is possible with -1 and consumption with 1.
+    processes: int, optional
+        Number of processes to be used (the default is taken from
+        `cobra.Configuration.processes`).
+    pool : MetaboliteExchangePool, optional
+        A running pool of workers for the same model that is used instead of
+        starting new processes.
+    prune : bool, optional
+        Whether to skip metabolites whose result can be proven without
+        solving their exchange problem (default False).
+
+    Returns
+    -------
+    list
+        The identifiers of blocked metabolites.
+
+    """
+    if pool is not None:
+        return pool.find_blocked(coefficient, prune=prune)
+    with MetaboliteExchangePool(model, processes=processes) as pool:
+        return pool.find_blocked(coefficient, prune=prune)
+
+
+def find_metabolites_not_produced_with_open_bounds(
+    model, processes=None, pool=None, prune=False
+):
     """
     Return metabolite identifiers that cannot be produced with open exchanges.
 
@@ -678,6 +1610,11 @@ def find_metabolites_not_produced_with_open_bounds(model, processes=None):
     processes: int, optional
         Number of processes to be used (the default is taken from
         `cobra.Configuration.processes`).
+    pool : MetaboliteExchangePool, optional
+        A running pool of workers for the same model.
+    prune : bool, optional
+        Whether to skip metabolites whose result can be proven without
+        solving their exchange problem (default False).
 
     Returns
     -------
@@ -685,10 +1622,14 @@ def find_metabolites_not_produced_with_open_bounds(model, processes=None):
         The metabolite identifiers that could not be produced.
 
     """
-    return find_blocked_metabolites(model, -1, processes=processes)
+    return find_blocked_metabolites(
+        model, -1, processes=processes, pool=pool, prune=prune
+    )
 
 
-def find_metabolites_not_consumed_with_open_bounds(model, processes=None):
+def find_metabolites_not_consumed_with_open_bounds(
+    model, processes=None, pool=None, prune=False
+):
     """
     Return metabolite identifiers that cannot be consumed with open exchanges.
 
@@ -702,6 +1643,11 @@ def find_metabolites_not_consumed_with_open_bounds(model, processes=None):
     processes: int, optional
         Number of processes to be used (the default is taken from
         `cobra.Configuration.processes`).
+    pool : MetaboliteExchangePool, optional
+        A running pool of workers for the same model.
+    prune : bool, optional
+        Whether to skip metabolites whose result can be proven without
+        solving their exchange problem (default False).
 
     Returns
     -------
@@ -709,7 +1655,9 @@ def find_metabolites_not_consumed_with_open_bounds(model, processes=None):
         The metabolite identifiers that could not be consumed.
 
     """
-    return find_blocked_metabolites(model, 1, processes=processes)
+    return find_blocked_metabolites(
+        model, 1, processes=processes, pool=pool, prune=prune
+    )
 
 
 def find_reactions_with_unbounded_flux_default_condition(model):
@@ -736,7 +1684,7 @@ def find_reactions_with_unbounded_flux_default_condition(model):
 
     """
     try:
-        fva_result = flux_variability_analysis(model, fraction_of_optimum=1.0)
+        fva_result = con_helpers.flux_variability(model, fraction_of_optimum=1.0)
     except Infeasible as err:
         LOGGER.error(
             "Failed to find reactions with unbounded flux "
@@ -23,16 +23,22 @@ from collections import defaultdict
 
 import cobra
 import numpy as np
-import sympy
+from cobra.flux_analysis import flux_variability_analysis
 from numpy.linalg import svd
-from optlang.symbolics import add
-from pylru import lrudecorator
+from optlang.symbolics import Zero
+from scipy import sparse
 from six import iteritems, itervalues
 
+from memote.support.cache import model_cache
 from memote.support.helpers import find_biomass_reaction
 
 
-__all__ = ("stoichiometry_matrix", "nullspace")
+__all__ = (
+    "stoichiometry_matrix",
+    "sparse_stoichiometry_matrix",
+    "nullspace",
+    "flux_variability",
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -71,13 +77,51 @@ def add_reaction_constraints(model, reactions, Constraint):
         The constraint class for the specific interface.
 
     """
-    constraints = []
-    for rxn in reactions:
-        expression = add(
-            [c * model.variables[m.id] for m, c in rxn.metabolites.items()]
-        )
-        constraints.append(Constraint(expression, lb=0, ub=0, name=rxn.id))
+    constraints = [Constraint(Zero, lb=0, ub=0, name=rxn.id) for rxn in reactions]
     model.add(constraints)
+    model.update()
+    for rxn, constraint in zip(reactions, constraints):
+        constraint.set_linear_coefficients(
+            {model.variables[m.id]: c for m, c in iteritems(rxn.metabolites)}
+        )
+
+
+def _stoichiometry_coordinates(metabolites, reactions):
+    """
+    Return the coordinate (COO) representation of a stoichiometry matrix.
+
+    Parameters
+    ----------
+    metabolites : iterable
+        A somehow ordered list of unique metabolites.
+    reactions : iterable
+        A somehow ordered list of unique reactions.
+
+    Returns
+    -------
+    tuple
+        The row indexes, column indexes, and coefficients of all non-zero
+        entries as `numpy.array`s followed by the metabolite and reaction index
+        mappings.
+
+    """
+    met_index = dict((met, i) for i, met in enumerate(metabolites))
+    rxn_index = dict((rxn, j) for j, rxn in enumerate(reactions))
+    rows = []
+    columns = []
+    coefficients = []
+    for rxn, j in iteritems(rxn_index):
+        stoichiometry = rxn.metabolites
+        rows.extend(met_index[met] for met in stoichiometry)
+        columns.extend([j] * len(stoichiometry))
+        coefficients.extend(itervalues(stoichiometry))
+    return (
+        np.asarray(rows, dtype=int),
+        np.asarray(columns, dtype=int),
+        np.asarray(coefficients, dtype=float),
+        met_index,
+        rxn_index,
+    )
 
 
 def stoichiometry_matrix(metabolites, reactions):
@@ -103,18 +147,64 @@ def stoichiometry_matrix(metabolites, reactions):
     dict
         A dictionary mapping reactions to column indexes.
 
+    See Also
+    --------
+    sparse_stoichiometry_matrix
+        For large models whose dense matrix does not fit into memory.
+
     """
-    matrix = np.zeros((len(metabolites), len(reactions)))
-    met_index = dict((met, i) for i, met in enumerate(metabolites))
-    rxn_index = dict()
-    for i, rxn in enumerate(reactions):
-        rxn_index[rxn] = i
-        for met, coef in iteritems(rxn.metabolites):
-            j = met_index[met]
-            matrix[j, i] = coef
+    rows, columns, coefficients, met_index, rxn_index = _stoichiometry_coordinates(
+        metabolites, reactions
+    )
+    matrix = np.zeros((len(met_index), len(rxn_index)))
+    matrix[rows, columns] = coefficients
     return matrix, met_index, rxn_index
 
 
+def sparse_stoichiometry_matrix(metabolites, reactions, fmt="csc"):
+    """
+    Return the sparse stoichiometry matrix representation of a set of reactions.
+
+    The reactions and metabolites order is respected. All metabolites are
+    expected to be contained and complete in terms of the reactions. Only the
+    non-zero coefficients are stored such that even models with tens of
+    thousands of reactions are represented in a few megabytes.
+
+    Parameters
+    ----------
+    metabolites : iterable
+        A somehow ordered list of unique metabolites.
+    reactions : iterable
+        A somehow ordered list of unique reactions.
+    fmt : {"csc", "csr", "coo"}, optional
+        The sparse matrix format to return (default compressed sparse column).
+
+    Returns
+    -------
+    scipy.sparse.spmatrix
+        The sparse 2D matrix that represents the stoichiometry matrix.
+    dict
+        A dictionary mapping metabolites to row indexes.
+    dict
+        A dictionary mapping reactions to column indexes.
+
+    """
+    rows, columns, coefficients, met_index, rxn_index = _stoichiometry_coordinates(
+        metabolites, reactions
+    )
+    matrix = sparse.coo_matrix(
+        (coefficients, (rows, columns)), shape=(len(met_index), len(rxn_index))
+    )
+    return matrix.asformat(fmt), met_index, rxn_index
+
+
+def _dense(matrix):
+    """Return a dense, at least 2-D representation of the matrix."""
+    if sparse.issparse(matrix):
+        matrix = matrix.toarray()
+    return np.atleast_2d(matrix)
+
+
 def rank(matrix, atol=1e-13, rtol=0):
     """
     Estimate the rank, i.e., the dimension of the column space, of a matrix.
@@ -124,7 +214,7 @@ def rank(matrix, atol=1e-13, rtol=0):
 
     Parameters
     ----------
-    matrix : ndarray
+    matrix : ndarray or scipy.sparse.spmatrix
         The matrix should be at most 2-D.  A 1-D array with length k
         will be treated as a 2-D with shape (1, k)
     atol : float
@@ -142,6 +232,8 @@ def rank(matrix, atol=1e-13, rtol=0):
         tol = max(atol, rtol * smax)
     Singular values smaller than ``tol`` are considered to be zero.
 
+    Sparse matrices are converted to dense arrays for the decomposition.
+
     Returns
     -------
     int
@@ -154,7 +246,7 @@ def rank(matrix, atol=1e-13, rtol=0):
         provide the option of the absolute tolerance.
 
     """
-    matrix = np.atleast_2d(matrix)
+    matrix = _dense(matrix)
     sigma = svd(matrix, compute_uv=False)
     tol = max(atol, rtol * sigma[0])
     return int((sigma >= tol).sum())
@@ -169,7 +261,7 @@ def nullspace(matrix, atol=1e-13, rtol=0.0):
 
     Parameters
     ----------
-    matrix : ndarray
+    matrix : ndarray or scipy.sparse.spmatrix
         The matrix should be at most 2-D.  A 1-D array with length k
         will be treated as a 2-D with shape (1, k)
     atol : float
@@ -187,6 +279,8 @@ def nullspace(matrix, atol=1e-13, rtol=0.0):
         tol = max(atol, rtol * smax)
     Singular values smaller than ``tol`` are considered to be zero.
 
+    Sparse matrices are converted to dense arrays for the decomposition.
+
     Returns
     -------
     ndarray
@@ -200,14 +294,14 @@ def nullspace(matrix, atol=1e-13, rtol=0.0):
     https://scipy.github.io/old-wiki/pages/Cookbook/RankNullspace.html
 
     """  # noqa: D402
-    matrix = np.atleast_2d(matrix)
+    matrix = _dense(matrix)
     _, sigma, vh = svd(matrix)
     tol = max(atol, rtol * sigma[0])
     num_nonzero = (sigma >= tol).sum()
     return vh[num_nonzero:].conj().T
 
 
-@lrudecorator(size=2)
+@model_cache
 def get_interface(model):
     """
     Return the interface specific classes.
@@ -226,7 +320,7 @@ def get_interface(model):
     )
 
 
-@lrudecorator(size=2)
+@model_cache
 def get_internals(model):
     """
     Return non-boundary reactions and their metabolites.
@@ -283,33 +377,32 @@ def create_milp_problem(kernel, metabolites, Model, Variable, Constraint, Object
         len(metabolites) == kernel.shape[0]
     ), "metabolite vector and first nullspace dimension must be equal"
     ns_problem = Model()
-    k_vars = list()
-    for met in metabolites:
-        # The element y[i] of the mass vector.
-        y_var = Variable(met.id)
-        k_var = Variable("k_{}".format(met.id), type="binary")
-        k_vars.append(k_var)
-        ns_problem.add([y_var, k_var])
-        # These following constraints are equivalent to 0 <= y[i] <= k[i].
-        ns_problem.add(Constraint(y_var - k_var, ub=0, name="switch_{}".format(met.id)))
-        ns_problem.add(Constraint(y_var, lb=0, name="switch2_{}".format(met.id)))
+    # The elements y[i] of the mass vector.
+    y_vars = [Variable(met.id, lb=0) for met in metabolites]
+    k_vars = [Variable("k_{}".format(met.id), type="binary") for met in metabolites]
+    ns_problem.add(y_vars + k_vars)
+    # Together with the lower bound of y[i], these constraints are equivalent
+    # to 0 <= y[i] <= k[i].
+    switches = [
+        Constraint(Zero, ub=0, name="switch_{}".format(met.id)) for met in metabolites
+    ]
+    ns_constraints = [
+        Constraint(Zero, lb=0, ub=0, name="ns_{}".format(j))
+        for j in range(kernel.shape[1])
+    ]
+    ns_problem.add(switches + ns_constraints)
     ns_problem.update()
-    # add nullspace constraints
-    for j, column in enumerate(kernel.T):
-        expression = sympy.Add(
-            *[
-                coef * ns_problem.variables[met.id]
-                for (met, coef) in zip(metabolites, column)
-                if coef != 0.0
-            ]
+    # Set all coefficients directly instead of building symbolic expressions.
+    for y_var, k_var, switch in zip(y_vars, k_vars, switches):
+        switch.set_linear_coefficients({y_var: 1.0, k_var: -1.0})
+    for column, constraint in zip(kernel.T, ns_constraints):
+        constraint.set_linear_coefficients(
+            {y_vars[i]: float(column[i]) for i in np.flatnonzero(column)}
         )
-        constraint = Constraint(expression, lb=0, ub=0, name="ns_{}".format(j))
-        ns_problem.add(constraint)
     # The objective is to minimize the binary indicators k[i], subject to
     # the above inequality constraints.
-    ns_problem.objective = Objective(1)
+    ns_problem.objective = Objective(Zero, direction="min", sloppy=True)
     ns_problem.objective.set_linear_coefficients({k_var: 1.0 for k_var in k_vars})
-    ns_problem.objective.direction = "min"
     return ns_problem, k_vars
 
 
@@ -340,11 +433,79 @@ def add_cut(problem, indicators, bound, Constraint):
            Bioinformatics 24, no. 19 (2008): 2245.
 
     """
-    cut = Constraint(sympy.Add(*indicators), ub=bound)
+    cut = Constraint(Zero, ub=bound)
     problem.add(cut)
+    problem.update()
+    cut.set_linear_coefficients({var: 1.0 for var in indicators})
     return cut
 
 
+def element_composition_matrix(metabolites):
+    """
+    Return the elemental composition of metabolites as a sparse matrix.
+
+    Each metabolite's formula is parsed only once.
+
+    Parameters
+    ----------
+    metabolites : iterable
+        A somehow ordered list of unique metabolites.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The 2D matrix with the amount of each element (columns) in each
+        metabolite (rows).
+    list
+        The elements in column order.
+    numpy.array
+        Whether the composition of each metabolite is known.
+
+    """
+    element_index = {}
+    rows = []
+    columns = []
+    amounts = []
+    known = []
+    for i, met in enumerate(metabolites):
+        elements = met.elements
+        known.append(elements is not None and len(elements) > 0)
+        if not known[-1]:
+            continue
+        for element, amount in iteritems(elements):
+            rows.append(i)
+            columns.append(element_index.setdefault(element, len(element_index)))
+            amounts.append(amount)
+    matrix = sparse.coo_matrix(
+        (np.asarray(amounts, dtype=float), (rows, columns)),
+        shape=(len(known), len(element_index)),
+    )
+    return matrix.tocsr(), list(element_index), np.asarray(known, dtype=bool)
+
+
+def charge_vector(metabolites):
+    """
+    Return the charges of metabolites.
+
+    Parameters
+    ----------
+    metabolites : iterable
+        A somehow ordered list of unique metabolites.
+
+    Returns
+    -------
+    numpy.array
+        The charge of each metabolite or zero if it is unknown.
+    numpy.array
+        Whether the charge of each metabolite is known.
+
+    """
+    charges = [met.charge for met in metabolites]
+    known = np.asarray([charge is not None for charge in charges], dtype=bool)
+    charges = [0 if charge is None else charge for charge in charges]
+    return np.asarray(charges, dtype=float), known
+
+
 def is_mass_balanced(reaction):
     """Confirm that a reaction is mass balanced."""
     balance = defaultdict(int)
@@ -364,3 +525,33 @@ def is_charge_balanced(reaction):
             return False
         charge += coefficient * metabolite.charge
     return charge == 0
+
+
+def flux_variability(model, fraction_of_optimum=1.0, loopless=False):
+    """
+    Return the flux variability of all reactions in the model.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    fraction_of_optimum : float, optional
+        The fraction of the objective's optimum that must be maintained
+        (default 1).
+    loopless : bool, optional
+        Whether to remove thermodynamically infeasible loops (default False).
+
+    Returns
+    -------
+    pandas.DataFrame
+        The minimum and maximum flux of each reaction.
+
+    Raises
+    ------
+    cobra.exceptions.Infeasible
+        If the model cannot be solved.
+
+    """
+    return flux_variability_analysis(
+        model, fraction_of_optimum=fraction_of_optimum, loopless=loopless
+    )
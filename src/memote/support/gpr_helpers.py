@@ -25,14 +25,19 @@ import ast
 import logging
 import re
 
+from pylru import lrucache
 
-__all__ = ("find_top_level_complex",)
+
+__all__ = ("find_top_level_complex", "compile_gpr", "CompiledGPR")
 
 
 logger = logging.getLogger(__name__)
-logical_and = re.compile(r"(and)|([&]{1,2})", flags=re.IGNORECASE)
-logical_or = re.compile(r"(or)|([|]{1,2})", flags=re.IGNORECASE)
-escape_chars = re.compile(r"[.-]")
+gpr_tokens = re.compile(r"\s+|([()])")
+logical_and = re.compile(r"^(and|[&]{1,2})$", flags=re.IGNORECASE)
+logical_or = re.compile(r"^(or|[|]{1,2})$", flags=re.IGNORECASE)
+
+# Compiled GPR associations by their rule string.
+_GPR_CACHE = lrucache(65536)
 
 
 class DummySet(object):
@@ -105,6 +110,135 @@ class GPRVisitor(ast.NodeVisitor):
         self._current.add(node.id)
 
 
+class CompiledGPR(object):
+    """
+    Represent a parsed gene-protein-reaction (GPR) association.
+
+    Attributes
+    ----------
+    rule : str
+        The GPR association as a string.
+    tree : tuple or str or None
+        A compact expression tree whose inner nodes are pairs of a Boolean
+        operator (``"and"`` or ``"or"``) and a tuple of operands and whose
+        leaves are gene identifiers. None if the association is empty.
+    genes : frozenset
+        The identifiers of all genes in the association.
+    complex_size : int
+        The size of the symmetric difference between the elements to the left
+        and to the right of the top level logical AND.
+
+    """
+
+    __slots__ = ("rule", "tree", "genes", "complex_size")
+
+    def __init__(self, rule, tree, genes, complex_size, **kwargs):
+        """Initialize a compiled GPR association."""
+        super(CompiledGPR, self).__init__(**kwargs)
+        self.rule = rule
+        self.tree = tree
+        self.genes = genes
+        self.complex_size = complex_size
+
+    def is_functional(self, knockouts=frozenset()):
+        """
+        Evaluate the association with some of its genes knocked out.
+
+        Parameters
+        ----------
+        knockouts : set, optional
+            The identifiers of the genes that are knocked out.
+
+        Returns
+        -------
+        bool
+            Whether the association still holds. An empty association always
+            does.
+
+        """
+        if self.tree is None:
+            return True
+        return _evaluate(self.tree, knockouts)
+
+
+def _evaluate(node, knockouts):
+    """Evaluate a compact expression tree given knocked out genes."""
+    if isinstance(node, tuple):
+        operator, operands = node
+        if operator == "and":
+            return all(_evaluate(child, knockouts) for child in operands)
+        return any(_evaluate(child, knockouts) for child in operands)
+    return node not in knockouts
+
+
+def _build_tree(node, genes):
+    """Convert an expression node into a compact expression tree."""
+    if isinstance(node, ast.BoolOp):
+        operator = "and" if isinstance(node.op, ast.And) else "or"
+        return operator, tuple(_build_tree(child, genes) for child in node.values)
+    if isinstance(node, ast.Name):
+        return genes[node.id]
+    raise SyntaxError(
+        "Unexpected element {} in a GPR association.".format(type(node).__name__)
+    )
+
+
+def compile_gpr(gpr):
+    """
+    Parse a GPR association once and cache the result by its string.
+
+    Gene identifiers are replaced by placeholder names before parsing such
+    that identifiers which are not valid Python names, e.g., ``"1234.1"``,
+    are parsed correctly.
+
+    Parameters
+    ----------
+    gpr : str
+        The gene-protein-reaction association as a string.
+
+    Returns
+    -------
+    CompiledGPR
+        The parsed association.
+
+    Raises
+    ------
+    SyntaxError
+        If the association is not a valid Boolean expression.
+
+    """
+    try:
+        return _GPR_CACHE[gpr]
+    except KeyError:
+        pass
+    logger.debug("%r", gpr)
+    genes = {}
+    conform = []
+    for token in gpr_tokens.split(gpr):
+        if not token:
+            continue
+        elif token in ("(", ")"):
+            conform.append(token)
+        elif logical_and.match(token):
+            conform.append("and")
+        elif logical_or.match(token):
+            conform.append("or")
+        else:
+            conform.append(genes.setdefault(token, "g{}".format(len(genes))))
+    if len(conform) == 0:
+        compiled = CompiledGPR(gpr, None, frozenset(), 0)
+    else:
+        expression = ast.parse(" ".join(conform), mode="eval")
+        walker = GPRVisitor()
+        walker.visit(expression)
+        tree = _build_tree(expression.body, {v: k for k, v in genes.items()})
+        compiled = CompiledGPR(
+            gpr, tree, frozenset(genes), len(walker.left ^ walker.right)
+        )
+    _GPR_CACHE[gpr] = compiled
+    return compiled
+
+
 def find_top_level_complex(gpr):
     """
     Find unique elements of both branches of the top level logical AND.
@@ -121,11 +255,4 @@ def find_top_level_complex(gpr):
         the left of the top level logical AND and the right set.
 
     """
-    logger.debug("%r", gpr)
-    conform = logical_and.sub("and", gpr)
-    conform = logical_or.sub("or", conform)
-    conform = escape_chars.sub("_", conform)
-    expression = ast.parse(conform)
-    walker = GPRVisitor()
-    walker.visit(expression)
-    return len(walker.left ^ walker.right)
+    return compile_gpr(gpr).complex_size
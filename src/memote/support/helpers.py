@@ -19,9 +19,11 @@
 
 from __future__ import absolute_import
 
+import json
 import logging
 import re
-from collections import defaultdict
+import weakref
+from collections import defaultdict, namedtuple
 
 
 try:
@@ -36,11 +38,11 @@ import numpy as np
 import pandas as pd
 from cobra.exceptions import Infeasible
 from cobra.medium.boundary_types import find_boundary_types
-from pylru import lrudecorator
 from six import iteritems, itervalues
 
 import memote.support.data
 import memote.utils as utils
+from memote.support.cache import model_cache
 
 
 LOGGER = logging.getLogger(__name__)
@@ -58,12 +60,9 @@ TRANSPORT_RXN_SBO_TERMS = [
 ]
 
 
-# Read the MetaNetX shortlist to identify specific metabolite IDs across
-# different namespaces.
-with files(memote.support.data).joinpath("met_id_shortlist.json").open(
-    mode="r", encoding="utf-8"
-) as file_handle:
-    METANETX_SHORTLIST = pd.read_json(file_handle)
+# The MetaNetX shortlist to identify specific metabolite IDs across different
+# namespaces. It is read on first use by `get_metanetx_shortlist`.
+_METANETX_SHORTLIST = None
 
 
 # Provide a compartment shortlist to identify specific compartments whenever
@@ -110,6 +109,37 @@ COMPARTMENT_SHORTLIST = {
 }
 
 
+def get_metanetx_shortlist():
+    """
+    Return the MetaNetX shortlist, reading it on first use.
+
+    The shortlist is shipped as compact JSON that omits namespaces without
+    cross-references and is read without pandas such that importing memote
+    does not pay for it.
+
+    Returns
+    -------
+    dict
+        A mapping from memote internal MetaNetX metabolite identifiers to an
+        ordered mapping of namespaces to lists of cross-referenced identifiers.
+
+    """
+    global _METANETX_SHORTLIST
+    if _METANETX_SHORTLIST is None:
+        with files(memote.support.data).joinpath("met_id_shortlist.json").open(
+            mode="r", encoding="utf-8"
+        ) as file_handle:
+            _METANETX_SHORTLIST = json.load(file_handle)
+    return _METANETX_SHORTLIST
+
+
+def __getattr__(name):
+    """Provide the MetaNetX shortlist as a data frame for compatibility."""
+    if name == "METANETX_SHORTLIST":
+        return pd.DataFrame(get_metanetx_shortlist())
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 def find_transported_elements(rxn):
     """
     Return a dictionary showing the amount of transported elements of a rxn.
@@ -152,7 +182,7 @@ def find_transported_elements(rxn):
     return delta_dict
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_transport_reactions(model):
     """
     Return a list of all transport reactions.
@@ -391,7 +421,7 @@ def filter_identifier(component, buzzwords):
     return any(b in identifier for b in buzzwords)
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_biomass_reaction(model):
     """
     Return a list of the biomass reaction(s) of the model.
@@ -471,7 +501,7 @@ def find_biomass_reaction(model):
     return []
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_demand_reactions(model):
     """
     Return a list of demand reactions.
@@ -511,7 +541,7 @@ def find_demand_reactions(model):
     return find_boundary_types(model, "demand", extracellular)
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_sink_reactions(model):
     """
     Return a list of sink reactions.
@@ -550,7 +580,7 @@ def find_sink_reactions(model):
     return find_boundary_types(model, "sink", extracellular)
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_exchange_rxns(model):
     """
     Return a list of exchange reactions.
@@ -828,9 +858,81 @@ def find_compartment_id_in_model(model, compartment_id):
         return largest_compartment_id_met(model)
 
 
+# Identifiers consisting of these characters only are matched literally by the
+# regular expressions that used to look them up.
+_LITERAL_ID = re.compile(r"^[a-zA-Z0-9_\-]+$")
+_COMPARTMENT_SUFFIX = re.compile(r"^[a-zA-Z0-9]+$")
+
+MetaboliteIndex = namedtuple(
+    "MetaboliteIndex", ["signature", "by_id", "by_annotation", "position"]
+)
+
+# Indexes are kept for as long as their model exists and rebuilt whenever the
+# identifiers or annotations of a model's metabolites change.
+_METABOLITE_INDEXES = weakref.WeakKeyDictionary()
+
+
+def _metabolite_index(model):
+    """
+    Return the (cached) reverse lookup tables of a model's metabolites.
+
+    Metabolites are indexed by their identifier, their identifier without a
+    compartment suffix, and each of their flattened annotation values. The
+    index is rebuilt when metabolites are added, removed, renamed, or when
+    their annotation changes.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    MetaboliteIndex
+        The lookup tables from keys to lists of metabolites in model order and
+        from metabolites to their position in the model.
+
+    """
+    # The index is looked up by every search for a metabolite. Unlike
+    # `model_version`, its signature only covers what is indexed.
+    signature = (
+        tuple(map(id, model.metabolites)),
+        repr([(met.id, met.annotation) for met in model.metabolites]),
+    )
+    index = _METABOLITE_INDEXES.get(model)
+    if index is not None and index.signature == signature:
+        return index
+    by_id = defaultdict(list)
+    by_annotation = defaultdict(list)
+    for met in model.metabolites:
+        by_id[met.id].append(met)
+        prefix, _, suffix = met.id.rpartition("_")
+        if prefix and _COMPARTMENT_SUFFIX.match(suffix):
+            by_id[prefix].append(met)
+        for value in set(utils.flatten(met.annotation.values())):
+            by_annotation[value].append(met)
+    index = MetaboliteIndex(
+        signature,
+        dict(by_id),
+        dict(by_annotation),
+        {met: i for i, met in enumerate(model.metabolites)},
+    )
+    _METABOLITE_INDEXES[model] = index
+    return index
+
+
+def _find_by_id(model, index, ident):
+    """Return metabolites whose identifier is ident with an optional suffix."""
+    ident = "{}".format(ident)
+    if _LITERAL_ID.match(ident):
+        return list(index.by_id.get(ident, []))
+    regex = re.compile("^{}(_[a-zA-Z0-9]+)?$".format(ident))
+    return model.metabolites.query(regex, attribute="id")
+
+
 def find_met_in_model(model, mnx_id, compartment_id=None):
     """
-    Return specific metabolites by looking up IDs in METANETX_SHORTLIST.
+    Return specific metabolites by looking up IDs in the MetaNetX shortlist.
 
     Parameters
     ----------
@@ -838,7 +940,7 @@ def find_met_in_model(model, mnx_id, compartment_id=None):
         The metabolic model under investigation.
     mnx_id : string
         Memote internal MetaNetX metabolite identifier used to map between
-        cross-references in the METANETX_SHORTLIST.
+        cross-references in the MetaNetX shortlist.
     compartment_id : string, optional
         ID of the specific compartment where the metabolites should be found.
         Defaults to returning matching metabolites from all compartments.
@@ -849,48 +951,32 @@ def find_met_in_model(model, mnx_id, compartment_id=None):
         cobra.Metabolite(s) matching the mnx_id.
 
     """
-
-    def compare_annotation(annotation):
-        """
-        Return annotation IDs that match to METANETX_SHORTLIST references.
-
-        Compares the set of METANETX_SHORTLIST references for a given mnx_id
-        and the annotation IDs stored in a given annotation dictionary.
-        """
-        query_values = set(utils.flatten(annotation.values()))
-        ref_values = set(utils.flatten(METANETX_SHORTLIST[mnx_id]))
-        return query_values & ref_values
-
     # Make sure that the MNX ID we're looking up exists in the metabolite
     # shortlist.
-    if mnx_id not in METANETX_SHORTLIST.columns:
+    shortlist = get_metanetx_shortlist()
+    if mnx_id not in shortlist:
         raise ValueError(
             "{} is not in the MetaNetX Shortlist! Make sure "
             "you typed the ID correctly, if yes, update the "
             "shortlist by updating and re-running the script "
             "generate_mnx_shortlists.py.".format(mnx_id)
         )
-    candidates = []
     # The MNX ID used in the model may or may not be tagged with a compartment
-    # tag e.g. `MNXM23141_c` vs. `MNXM23141`, which is tested with the
-    # following regex.
-    # If the MNX ID itself cannot be found as an ID, we try all other
-    # identifiers that are provided by our shortlist of MetaNetX' mapping
-    # table.
-    regex = re.compile("^{}(_[a-zA-Z0-9]+)?$".format(mnx_id))
-    if model.metabolites.query(regex):
-        candidates = model.metabolites.query(regex)
-    elif model.metabolites.query(compare_annotation, attribute="annotation"):
-        candidates = model.metabolites.query(compare_annotation, attribute="annotation")
-    else:
-        for value in METANETX_SHORTLIST[mnx_id]:
-            if value:
-                for ident in value:
-                    regex = re.compile("^{}(_[a-zA-Z0-9]+)?$".format(ident))
-                    if model.metabolites.query(regex, attribute="id"):
-                        candidates.extend(
-                            model.metabolites.query(regex, attribute="id")
-                        )
+    # tag e.g. `MNXM23141_c` vs. `MNXM23141`, both of which are indexed.
+    # If the MNX ID itself cannot be found as an ID, we try the metabolite
+    # annotations and then all other identifiers that are provided by our
+    # shortlist of MetaNetX' mapping table.
+    index = _metabolite_index(model)
+    candidates = _find_by_id(model, index, mnx_id)
+    if not candidates:
+        annotated = set()
+        for value in set(utils.flatten(itervalues(shortlist[mnx_id]))):
+            annotated.update(index.by_annotation.get(value, []))
+        candidates = sorted(annotated, key=index.position.get)
+    if not candidates:
+        for value in itervalues(shortlist[mnx_id]):
+            for ident in value:
+                candidates.extend(_find_by_id(model, index, ident))
 
     # Return a list of all possible candidates if no specific compartment ID
     # is provided.
@@ -933,6 +1019,41 @@ def find_met_in_model(model, mnx_id, compartment_id=None):
         return candidates_in_compartment
 
 
+def find_mets_in_model(model, mnx_ids, compartment_id=None):
+    """
+    Return specific metabolites for each of several MetaNetX identifiers.
+
+    All identifiers are resolved with the same index of the model's
+    metabolites.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    mnx_ids : iterable
+        Memote internal MetaNetX metabolite identifiers used to map between
+        cross-references in the MetaNetX shortlist.
+    compartment_id : string, optional
+        ID of the specific compartment where the metabolites should be found.
+        Defaults to returning matching metabolites from all compartments.
+
+    Returns
+    -------
+    list
+        For each of the mnx_ids, the list of cobra.Metabolite(s) matching it.
+
+    Raises
+    ------
+    ValueError
+        If one of the mnx_ids is not in the MetaNetX shortlist.
+    RuntimeError
+        If no or more than one metabolite matches one of the mnx_ids in the
+        given compartment.
+
+    """
+    return [find_met_in_model(model, mnx_id, compartment_id) for mnx_id in mnx_ids]
+
+
 def find_objective_function(model):
     """
     Return reactions that are part of the objective function.
@@ -946,7 +1067,7 @@ def find_objective_function(model):
     return [rxn for rxn in model.reactions if rxn.objective_coefficient != 0]
 
 
-@lrudecorator(size=2)
+@model_cache
 def find_bounds(model):
     """
     Return the median upper and lower bound of the metabolic model.
@@ -20,14 +20,52 @@
 from __future__ import absolute_import
 
 import logging
+from collections import namedtuple
 
 import numpy as np
 
 import memote.support.consistency_helpers as con_helpers
+from memote.support.cache import model_cache
 
 
 LOGGER = logging.getLogger(__name__)
 
+MatrixDecomposition = namedtuple(
+    "MatrixDecomposition", ["num_metabolites", "num_reactions", "rank"]
+)
+
+
+@model_cache
+def stoichiometric_decomposition(model):
+    """
+    Return the (cached) decomposition of the model's stoichiometric matrix.
+
+    A single singular value decomposition yields the rank of the matrix from
+    which the dimensions of the (left) null space follow by the rank-nullity
+    theorem. The result is cached for the current state of the model.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    MatrixDecomposition
+        The number of metabolites (rows), the number of reactions (columns),
+        and the rank of the stoichiometric matrix.
+
+    """
+    s_matrix, _, _ = con_helpers.sparse_stoichiometry_matrix(
+        model.metabolites, model.reactions, fmt="coo"
+    )
+    num_mets, num_rxns = s_matrix.shape
+    if num_mets == 0 or num_rxns == 0:
+        rank = 0
+    else:
+        rank = con_helpers.rank(s_matrix)
+    return MatrixDecomposition(num_mets, num_rxns, rank)
+
 
 def absolute_extreme_coefficient_ratio(model):
     """
@@ -39,18 +77,20 @@ def absolute_extreme_coefficient_ratio(model):
         The metabolic model under investigation.
 
     """
-    s_matrix, _, _ = con_helpers.stoichiometry_matrix(
+    s_matrix, _, _ = con_helpers.sparse_stoichiometry_matrix(
         model.metabolites, model.reactions
     )
-    abs_matrix = np.abs(s_matrix)
-    return abs_matrix.max(), abs_matrix[abs_matrix > 0].min()
+    # Only the non-zero coefficients are stored explicitly.
+    abs_coefficients = np.abs(s_matrix.data)
+    return abs_coefficients.max(), abs_coefficients[abs_coefficients > 0].min()
 
 
 def number_independent_conservation_relations(model):
     """
     Return the number of conserved metabolite pools.
 
-    This number is given by the left null space of the stoichiometric matrix.
+    This number is given by the dimension of the left null space of the
+    stoichiometric matrix, i.e., the number of metabolites minus its rank.
 
     Parameters
     ----------
@@ -58,11 +98,10 @@ def number_independent_conservation_relations(model):
         The metabolic model under investigation.
 
     """
-    s_matrix, _, _ = con_helpers.stoichiometry_matrix(
-        model.metabolites, model.reactions
-    )
-    left_ns = con_helpers.nullspace(s_matrix.T)
-    return left_ns.shape[1] if len(left_ns) > 1 else 0
+    decomposition = stoichiometric_decomposition(model)
+    if decomposition.num_metabolites <= 1:
+        return 0
+    return decomposition.num_metabolites - decomposition.rank
 
 
 def matrix_rank(model):
@@ -75,10 +114,7 @@ def matrix_rank(model):
         The metabolic model under investigation.
 
     """
-    s_matrix, _, _ = con_helpers.stoichiometry_matrix(
-        model.metabolites, model.reactions
-    )
-    return con_helpers.rank(s_matrix)
+    return stoichiometric_decomposition(model).rank
 
 
 def degrees_of_freedom(model):
@@ -106,7 +142,5 @@ def degrees_of_freedom(model):
        (2007).
 
     """
-    s_matrix, _, _ = con_helpers.stoichiometry_matrix(
-        model.metabolites, model.reactions
-    )
-    return s_matrix.shape[1] - matrix_rank(model)
+    decomposition = stoichiometric_decomposition(model)
+    return decomposition.num_reactions - decomposition.rank
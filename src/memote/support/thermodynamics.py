@@ -20,19 +20,37 @@
 from __future__ import absolute_import
 
 import logging
-from collections import Iterable, defaultdict
-from sys import version_info
+import multiprocessing
+from collections import defaultdict
+from os.path import join
 
-from six import iteritems, string_types
 
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 
-if version_info[:2] >= (3, 5):
-    from equilibrator_api import CompoundMatcher, Reaction
+import numpy as np
+from cobra import Configuration
+from scipy import sparse
+from six import iteritems, string_types
 
-    compound_matcher = CompoundMatcher()
+from memote.support.cache import DiskCache, user_cache_dir
 
 
 logger = logging.getLogger(__name__)
+cobra_configuration = Configuration()
+
+# The eQuilibrator reaction class and settings are imported once per process
+# by `_init_equilibrator`, which is also the initializer of worker processes.
+_Reaction = None
+_settings = None
+
+# The batched computation of reversibility indexes follows the eQuilibrator API
+# 0.1.x. Before computing any indexes, it is compared once per process with
+# eQuilibrator's own computation for this reaction (G6PP).
+_SAMPLE_STOICHIOMETRY = {"C00668": -1, "C00001": -1, "C00267": 1, "C00009": 1}
+_equilibrator_checked = False
 
 
 def get_smallest_compound_id(compounds_identifiers):
@@ -100,7 +118,7 @@ def map_metabolite2kegg(metabolite):
         # if metabolite.name:
         #     # The compound matcher uses regular expression and chokes
         #     # with a low level error on `[` in the name, for example.
-        #     df = compound_matcher.match(metabolite.name)
+        #     df = CompoundMatcher().match(metabolite.name)
         #     try:
         #         return df.loc[df["score"] > threshold, "CID"].iat[0]
         #     except (IndexError, AttributeError):
@@ -158,18 +176,208 @@ def translate_reaction(reaction, metabolite_mapping):
     return dict(stoichiometry)
 
 
-def find_thermodynamic_reversibility_index(reactions):
+def stoichiometry_key(stoichiometry):
+    """
+    Return a canonical string representation of a KEGG stoichiometry.
+
+    Parameters
+    ----------
+    stoichiometry : dict
+        A mapping from KEGG compound identifier to coefficient.
+
+    Returns
+    -------
+    str
+        The compound identifiers in sorted order with their coefficients.
+
+    """
+    return " ".join(
+        "{}:{!r}".format(kegg_id, float(coef))
+        for kegg_id, coef in sorted(iteritems(stoichiometry))
+    )
+
+
+def _init_equilibrator():
+    """Load the eQuilibrator backend in the current process."""
+    global _Reaction
+    global _settings
+    if _Reaction is None:
+        from equilibrator_api import Reaction, settings
+
+        _Reaction = Reaction
+        _settings = settings
+
+
+def _equilibrator_version():
+    """Return the version of the installed eQuilibrator API."""
+    try:
+        from importlib.metadata import version
+    except ImportError:
+        from pkg_resources import get_distribution
+
+        return get_distribution("equilibrator-api").version
+    return version("equilibrator-api")
+
+
+def _conditions():
+    """Return the aqueous conditions of the calculations."""
+    _init_equilibrator()
+    return "pH={},pMg={},I={},T={}".format(
+        _settings.DEFAULT_PH,
+        _settings.DEFAULT_PMG,
+        _settings.DEFAULT_IONIC_STRENGTH,
+        _settings.DEFAULT_TEMP,
+    )
+
+
+def _formation_energy(compound):
+    """Return the standard Gibbs energy of formation of a compound or NaN."""
+    try:
+        dG0_f_prime = compound.dG0_prime(
+            _settings.DEFAULT_PH,
+            _settings.DEFAULT_PMG,
+            _settings.DEFAULT_IONIC_STRENGTH,
+        )
+    except Exception:
+        return np.nan
+    return np.nan if dG0_f_prime is None else dG0_f_prime
+
+
+def _check_equilibrator():
+    """
+    Compare the batched reversibility index with eQuilibrator's own.
+
+    Raises
+    ------
+    RuntimeError
+        If the installed eQuilibrator API computes a different reversibility
+        index for the sample reaction.
+
+    """
+    global _equilibrator_checked
+    if _equilibrator_checked:
+        return
+    _init_equilibrator()
+    ((outcome, ln_gamma),) = _compute_reversibility_indexes(
+        [(_SAMPLE_STOICHIOMETRY, "G6PP")]
+    )
+    expected = _Reaction(_SAMPLE_STOICHIOMETRY, "G6PP").reversibility_index()
+    if outcome != "index" or not np.isclose(ln_gamma, expected, rtol=1e-6):
+        raise RuntimeError(
+            "The reversibility index of the sample reaction G6PP is {} but the "
+            "eQuilibrator API {} computes {}. Only versions 0.1.x are "
+            "supported.".format(ln_gamma, _equilibrator_version(), expected)
+        )
+    _equilibrator_checked = True
+
+
+def _compute_reversibility_indexes(batch):
+    """
+    Return the outcomes of computing the reversibility indexes of reactions.
+
+    The standard Gibbs energy of formation of each distinct compound is
+    computed once. Together with the compound by reaction stoichiometric
+    matrix of all balanced reactions, it yields their standard Gibbs energies
+    of reaction and thus reversibility indexes in a few matrix products.
+
+    Parameters
+    ----------
+    batch : list
+        Pairs of a mapping from KEGG compound identifier to coefficient
+        without protons and the identifier of a reaction.
+
+    Returns
+    -------
+    list
+        For each reaction one of ``("index", ln_gamma)``,
+        ``("incomplete", None)``, ``("unbalanced", None)``, or
+        ``("problematic", None)``.
+
+    """
+    _init_equilibrator()
+    outcomes = [None] * len(batch)
+    balanced = []
+    for i, (stoichiometry, rxn_id) in enumerate(batch):
+        try:
+            eq_rxn = _Reaction(stoichiometry, rxn_id)
+        except KeyError:
+            outcomes[i] = ("incomplete", None)
+            continue
+        if eq_rxn.check_full_reaction_balancing():
+            balanced.append((i, eq_rxn))
+        else:
+            outcomes[i] = ("unbalanced", None)
+    if len(balanced) == 0:
+        return outcomes
+    compound_index = {}
+    formation_energies = []
+    rows = []
+    columns = []
+    coefficients = []
+    for j, (_, eq_rxn) in enumerate(balanced):
+        for kegg_id in eq_rxn.kegg_ids:
+            if kegg_id not in compound_index:
+                compound_index[kegg_id] = len(formation_energies)
+                formation_energies.append(
+                    _formation_energy(eq_rxn.get_compound(kegg_id))
+                )
+            rows.append(compound_index[kegg_id])
+            columns.append(j)
+            coefficients.append(eq_rxn.get_coeff(kegg_id))
+    shape = (len(formation_energies), len(balanced))
+    stoichiometry = sparse.csc_matrix((coefficients, (rows, columns)), shape=shape)
+    incidence = sparse.csc_matrix((np.ones(len(rows)), (rows, columns)), shape=shape)
+    formation_energies = np.array(formation_energies, dtype=float)
+    unknown = np.isnan(formation_energies)
+    formation_energies[unknown] = 0.0
+    # Water does not count towards the coefficient sums.
+    weights = np.ones(shape[0])
+    if "C00001" in compound_index:
+        weights[compound_index["C00001"]] = 0.0
+    dG0_prime = stoichiometry.T.dot(formation_energies)
+    sum_coeff = stoichiometry.T.dot(weights)
+    abs_sum_coeff = abs(stoichiometry).T.dot(weights)
+    dGm_prime = dG0_prime + _settings.RT * sum_coeff * np.log(1e-3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ln_gamma = np.where(
+            abs_sum_coeff == 0,
+            np.inf,
+            (2.0 / abs_sum_coeff) * dGm_prime / _settings.RT,
+        )
+    # Reactions involving compounds without formation energy have no index.
+    problematic = (incidence.T.dot(unknown.astype(float)) > 0) & (abs_sum_coeff != 0)
+    for j, (i, _) in enumerate(balanced):
+        if problematic[j]:
+            outcomes[i] = ("problematic", None)
+        else:
+            outcomes[i] = ("index", float(ln_gamma[j]))
+    return outcomes
+
+
+def find_thermodynamic_reversibility_index(reactions, cache=True, processes=None):
     """
     Return the reversibility index of the given reactions.
 
     To determine the reversibility index, we calculate
     the reversibility index ln_gamma (see [1]_ section 3.5) of each reaction
-    using the eQuilibrator API [2]_.
+    using the eQuilibrator API [2]_. Computed indexes are stored in a
+    persistent cache keyed by the eQuilibrator version, the conditions, and
+    the KEGG stoichiometry of a reaction such that later runs only compute
+    the indexes of reactions they have not seen before.
 
     Parameters
     ----------
         reactions: list of cobra.Reaction
             A list of reactions for which to calculate the reversibility index.
+        cache: bool or memote.support.cache.DiskCache, optional
+            The persistent cache to use. If true (default), use the cache
+            ``reversibility_index.sqlite`` in the user cache directory, if
+            false, do not use any cache.
+        processes: int, optional
+            Number of processes to be used (the default is taken from
+            `cobra.Configuration.processes`). Each process loads the
+            eQuilibrator backend once and computes the indexes of a share of
+            the reactions that are not cached.
 
     Returns
     -------
@@ -187,6 +395,11 @@ def find_thermodynamic_reversibility_index(reactions):
         list of cobra.Reaction
             A list of reactions that are not chemically or redox balanced.
 
+    Raises
+    ------
+    RuntimeError
+        If the installed eQuilibrator API computes reversibility indexes
+        differently from version 0.1.x.
 
     References
     ----------
@@ -198,35 +411,81 @@ def find_thermodynamic_reversibility_index(reactions):
     .. [2] https://pypi.org/project/equilibrator-api/
 
     """
+    conditions = "{}|{}".format(_equilibrator_version(), _conditions())
     incomplete_mapping = []
     problematic_calculation = []
     reversibility_indexes = []
     unbalanced = []
     metabolite_mapping = {}
+    candidates = []
 
     for rxn in reactions:
         stoich = translate_reaction(rxn, metabolite_mapping)
         if len(stoich) < len(rxn.metabolites):
-            incomplete_mapping.append(rxn)
+            candidates.append((rxn, None, None))
             continue
-        try:
-            # Remove protons from stoichiometry.
-            if "C00080" in stoich:
-                del stoich["C00080"]
-            eq_rxn = Reaction(stoich, rxn.id)
-        except KeyError:
+        # Remove protons from stoichiometry.
+        if "C00080" in stoich:
+            del stoich["C00080"]
+        key = "{}|{}".format(conditions, stoichiometry_key(stoich))
+        candidates.append((rxn, stoich, key))
+    if cache is True:
+        disk_cache = DiskCache(join(user_cache_dir(), "reversibility_index.sqlite"))
+    elif cache:
+        disk_cache = cache
+    else:
+        disk_cache = None
+    known = {}
+    if disk_cache is not None:
+        known = disk_cache.get_many(key for _, _, key in candidates if key)
+    misses = [
+        (stoich, rxn.id)
+        for rxn, stoich, key in candidates
+        if stoich is not None and key not in known
+    ]
+    if len(misses) > 0:
+        _check_equilibrator()
+    if processes is None:
+        processes = cobra_configuration.processes
+    processes = min(processes, len(misses))
+    if processes > 1:
+        chunk_size = -(-len(misses) // processes)
+        batches = [
+            misses[start : start + chunk_size]
+            for start in range(0, len(misses), chunk_size)
+        ]
+        with multiprocessing.Pool(processes, initializer=_init_equilibrator) as pool:
+            outcomes = [
+                outcome
+                for batch in pool.map(_compute_reversibility_indexes, batches)
+                for outcome in batch
+            ]
+    else:
+        outcomes = _compute_reversibility_indexes(misses)
+    # Merge the outcomes back in the order of the given reactions.
+    outcomes = iter(outcomes)
+    computed = {}
+    for rxn, stoich, key in candidates:
+        if stoich is None:
             incomplete_mapping.append(rxn)
             continue
-        if eq_rxn.check_full_reaction_balancing():
-            try:
-                ln_rev_index = eq_rxn.reversibility_index()
-            # TODO (Moritz Beber): Which exceptions can we expect here?
-            except Exception:
-                problematic_calculation.append(rxn)
-                continue
+        if key in known:
+            reversibility_indexes.append((rxn, known[key]))
+            continue
+        outcome, ln_rev_index = next(outcomes)
+        if outcome == "index":
+            computed[key] = ln_rev_index
             reversibility_indexes.append((rxn, ln_rev_index))
-        else:
+        elif outcome == "incomplete":
+            incomplete_mapping.append(rxn)
+        elif outcome == "unbalanced":
             unbalanced.append(rxn)
+        else:
+            problematic_calculation.append(rxn)
+    if disk_cache is not None:
+        disk_cache.set_many(computed)
+        if disk_cache is not cache:
+            disk_cache.close()
     reversibility_indexes.sort(key=lambda p: abs(p[1]), reverse=True)
     return (
         reversibility_indexes,
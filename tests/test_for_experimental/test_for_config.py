@@ -35,6 +35,7 @@ from jsonschema import Draft4Validator, ValidationError
 from numpy import isclose
 
 from memote.experimental.config import ExperimentConfiguration
+from memote.support.cache import MODEL_CACHE
 
 
 DATA_PATH = join(dirname(__file__), "data")
@@ -58,6 +59,7 @@ def test_configuration_schema():
         ),
         "valid.yml",
         "medium_only.yml",
+        "essentiality_shared.yml",
     ],
 )
 def test_configuration(filename):
@@ -106,6 +108,28 @@ def test_load_essentiality(filename, model, experiment):
     assert (test["essential"].values == expected["essential"].values).all()
 
 
+@pytest.mark.parametrize(
+    "filename, model", [("essentiality_shared.yml", "textbook")], indirect=["model"]
+)
+def test_load_essentiality_shared_screen(filename, model):
+    """Expect experiments under the same conditions to share gene deletions."""
+    config = ExperimentConfiguration(join(DATA_PATH, filename))
+    config.validate()
+    config.load_medium(model)
+    config.load_essentiality(model)
+    first, second = config.essentiality.values()
+    assert first.processes == second.processes == 2
+    assert (
+        first.screen == second.screen == ("b0356", "b0727", "b1779", "b2416", "b3213")
+    )
+    for exp in (first, second):
+        hits = MODEL_CACHE.hits
+        test = exp.evaluate(model)
+        assert test["gene"].tolist() == exp.data["gene"].tolist()
+        assert (test["essential"].values == exp.data["essential"].values).all()
+    assert MODEL_CACHE.hits == hits + 1
+
+
 @pytest.mark.parametrize(
     "filename, model, experiment",
     [("growth.yml", "textbook", "core")],
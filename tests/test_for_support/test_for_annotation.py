@@ -395,6 +395,45 @@ def test_generate_gene_annotation_miriam_match(model, num, components, db):
     assert len(faulty) == num
 
 
+@pytest.mark.parametrize(
+    "model, components",
+    [
+        ("met_each_absent", "metabolites"),
+        ("met_broken_id", "metabolites"),
+        ("rxn_each_absent", "reactions"),
+        ("rxn_broken_id", "reactions"),
+        ("gene_each_absent", "genes"),
+        ("gene_broken_id", "genes"),
+    ],
+    indirect=["model"],
+)
+def test_generate_component_annotation_audit(model, components):
+    """Expect the audit to agree with the checks per database."""
+    audit = annotation.generate_component_annotation_audit(model, components)
+    elements = getattr(model, components)
+    for db in audit["present"].columns:
+        missing = annotation.generate_component_annotation_overview(elements, db)
+        faulty = annotation.generate_component_annotation_miriam_match(
+            elements, components, db
+        )
+        assert audit.index[~audit["present", db]].tolist() == [e.id for e in missing]
+        assert audit.index[~audit["valid", db]].tolist() == [e.id for e in faulty]
+
+
+@pytest.mark.parametrize("model", ["met_each_absent"], indirect=["model"])
+def test_generate_component_annotation_audit_in_place(model):
+    """Expect the audit to reflect annotations that are modified in place."""
+    audit = annotation.generate_component_annotation_audit(model, "metabolites")
+    assert not audit.at["met_c", ("present", "kegg.compound")]
+    model.metabolites.met_c.annotation["kegg.compound"] = "C00001"
+    audit = annotation.generate_component_annotation_audit(model, "metabolites")
+    assert audit.at["met_c", ("present", "kegg.compound")]
+    assert audit.at["met_c", ("valid", "kegg.compound")]
+    model.metabolites.met_c.annotation["kegg.compound"] = "broken"
+    audit = annotation.generate_component_annotation_audit(model, "metabolites")
+    assert not audit.at["met_c", ("valid", "kegg.compound")]
+
+
 @pytest.mark.parametrize(
     "model, namespace, num, components",
     [
@@ -412,3 +451,28 @@ def test_generate_component_id_namespace_overview(model, namespace, num, compone
     overview = annotation.generate_component_id_namespace_overview(model, components)
     distribution = overview.sum()
     assert distribution[namespace] == num
+
+
+@pytest.mark.parametrize(
+    "identifier, namespaces",
+    [
+        ("C00022", {"kegg.compound", "bigg.metabolite"}),
+        ("META:PYRUVATE", {"biocyc"}),
+    ],
+)
+def test_generate_component_id_namespace_overview_biocyc(identifier, namespaces):
+    """Expect BioCyc matches only for IDs that match no other namespace."""
+    model = cobra.Model()
+    model.add_metabolites([cobra.Metabolite(identifier)])
+    overview = annotation.generate_component_id_namespace_overview(model, "metabolites")
+    assert set(overview.columns[overview.loc[identifier]]) == namespaces
+
+
+@pytest.mark.parametrize("components", ["metabolites", "reactions", "genes"])
+def test_generate_component_id_namespace_overview_empty(components):
+    """Expect an empty Boolean table for a model without components."""
+    overview = annotation.generate_component_id_namespace_overview(
+        cobra.Model(), components
+    )
+    assert overview.empty
+    assert (overview.dtypes == bool).all()
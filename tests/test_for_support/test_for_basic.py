@@ -370,6 +370,24 @@ def dup_mets_in_c_wrong_annotation(base):
     return base
 
 
+@register_with(MODEL_REGISTRY)
+def dup_mets_multiple_groups(base):
+    """Provide a model with several groups of duplicate metabolites"""
+    met_a = cobra.Metabolite("a_c", compartment="c")
+    met_b = cobra.Metabolite("b_c", compartment="c")
+    met_c = cobra.Metabolite("c_c", compartment="c")
+    met_d = cobra.Metabolite("d_c", compartment="c")
+    met_e = cobra.Metabolite("a_e", compartment="e")
+    met_a.annotation["inchikey"] = "1231"
+    met_b.annotation["inchi"] = ["InChI=1S/B", "InChI=1S/b"]
+    met_c.annotation["inchikey"] = "1231"
+    met_c.annotation["inchi"] = ["InChI=1S/B", "InChI=1S/b"]
+    met_d.annotation["inchikey"] = "1231"
+    met_e.annotation["inchikey"] = "1231"
+    base.add_metabolites([met_a, met_b, met_c, met_d, met_e])
+    return base
+
+
 @register_with(MODEL_REGISTRY)
 def dup_rxns(base):
     """Provide a model with duplicate reactions"""
@@ -387,6 +405,25 @@ def dup_rxns(base):
     return base
 
 
+@register_with(MODEL_REGISTRY)
+def dup_rxns_multiple_groups(base):
+    """Provide a model like `dup_rxns` with three duplicates and a reversal"""
+    met_a = cobra.Metabolite("a_c", compartment="c")
+    met_b = cobra.Metabolite("b_c", compartment="c")
+    met_a.annotation["inchikey"] = "123"
+    met_b.annotation["inchikey"] = "456"
+    rxn_1 = cobra.Reaction("rxn1")
+    rev_1 = cobra.Reaction("rev1")
+    dup_1 = cobra.Reaction("dup1")
+    dup_2 = cobra.Reaction("dup2")
+    rxn_1.add_metabolites({met_a: -1, met_b: 1})
+    rev_1.add_metabolites({met_a: 1, met_b: -1})
+    dup_1.add_metabolites({met_a: -1, met_b: 1})
+    dup_2.add_metabolites({met_a: -1, met_b: 1})
+    base.add_reactions([rxn_1, rev_1, dup_1, dup_2])
+    return base
+
+
 @register_with(MODEL_REGISTRY)
 def dup_rxns_multiple_anns(base):
     """Provide a model like `dup_rxns` but with multiple annotations per rxn"""
@@ -421,6 +458,26 @@ def dup_rxns_partial_matching_multiple_anns(base):
     return base
 
 
+@register_with(MODEL_REGISTRY)
+def dup_rxns_overlapping_anns(base):
+    """Provide a model with several groups of partially matching annotations"""
+    rxn_1 = cobra.Reaction("rxn1")
+    rxn_2 = cobra.Reaction("rxn2")
+    rxn_3 = cobra.Reaction("rxn3")
+    rxn_4 = cobra.Reaction("rxn4")
+    rxn_5 = cobra.Reaction("rxn5")
+    rxn_1.annotation["kegg.reaction"] = "HEX"
+    rxn_1.annotation["metanetx.reaction"] = "MNXR1"
+    rxn_2.annotation["kegg.reaction"] = "HEX"
+    rxn_2.annotation["metanetx.reaction"] = "MNXR2"
+    rxn_3.annotation["kegg.reaction"] = "HEX"
+    rxn_3.annotation["metanetx.reaction"] = "MNXR1"
+    rxn_4.annotation["rhea"] = ["1", "2"]
+    rxn_5.annotation["rhea"] = ["2", "1"]
+    base.add_reactions([rxn_1, rxn_2, rxn_3, rxn_4, rxn_5])
+    return base
+
+
 @register_with(MODEL_REGISTRY)
 def dup_rxns_no_matching_multiple_anns(base):
     """Provide a model like `dup_rxns_multiple_anns` but with no matches"""
@@ -628,6 +685,24 @@ def identical_genes(base):
     return base
 
 
+@register_with(MODEL_REGISTRY)
+def identical_genes_groups(base):
+    """Provide a model with several groups of reactions with identical genes."""
+    rxn_1 = cobra.Reaction("RXN1")
+    rxn_1.gene_reaction_rule = "gene1 or gene2"
+    rxn_2 = cobra.Reaction("RXN2")
+    rxn_2.gene_reaction_rule = "gene3"
+    rxn_3 = cobra.Reaction("RXN3")
+    rxn_3.gene_reaction_rule = "gene2 and gene1"
+    rxn_4 = cobra.Reaction("RXN4")
+    rxn_4.gene_reaction_rule = "gene3"
+    rxn_5 = cobra.Reaction("RXN5")
+    rxn_5.gene_reaction_rule = "gene1"
+    rxn_6 = cobra.Reaction("RXN6")
+    base.add_reactions([rxn_1, rxn_2, rxn_3, rxn_4, rxn_5, rxn_6])
+    return base
+
+
 @register_with(MODEL_REGISTRY)
 def different_genes(base):
     """Provide a model with reactions with different genes."""
@@ -858,6 +933,32 @@ def test_find_unique_metabolites(model, num):
     assert len(basic.find_unique_metabolites(model)) == num
 
 
+def test_map_metabolites_to_structures():
+    """Expect structures to be merged transitively within compartments."""
+    met_a = cobra.Metabolite("a_c", compartment="c")
+    met_b = cobra.Metabolite("b_c", compartment="c")
+    met_c = cobra.Metabolite("c_c", compartment="c")
+    met_d = cobra.Metabolite("d_c", compartment="c")
+    met_e = cobra.Metabolite("a_e", compartment="e")
+    met_f = cobra.Metabolite("f_c", compartment="c")
+    met_a.annotation["inchikey"] = "A"
+    met_b.annotation["inchi"] = "B"
+    met_c.annotation["inchikey"] = "C"
+    met_d.annotation["inchikey"] = "A"
+    met_d.annotation["inchi"] = "B"
+    met_e.annotation["inchikey"] = "A"
+    met2mol = basic.map_metabolites_to_structures(
+        [met_a, met_b, met_c, met_d, met_e, met_f], ["c", "e"]
+    )
+    assert met2mol == {
+        met_a: "c-0",
+        met_b: "c-0",
+        met_c: "c-1",
+        met_d: "c-0",
+        met_e: "e-0",
+    }
+
+
 @pytest.mark.parametrize(
     "model, num",
     [("dup_mets_in_c", 1), ("dup_mets_in_c_wrong_annotation", 0), ("gpr_missing", 0)],
@@ -868,6 +969,17 @@ def test_find_duplicate_metabolites_in_compartments(model, num):
     assert len(basic.find_duplicate_metabolites_in_compartments(model)) == num
 
 
+@pytest.mark.parametrize("model", ["dup_mets_multiple_groups"], indirect=["model"])
+def test_find_duplicate_metabolites_in_compartments_pairs(model):
+    """Expect pairs of duplicates in the order of the model's metabolites."""
+    assert basic.find_duplicate_metabolites_in_compartments(model) == [
+        ("a_c", "c_c"),
+        ("a_c", "d_c"),
+        ("b_c", "c_c"),
+        ("c_c", "d_c"),
+    ]
+
+
 @pytest.mark.parametrize(
     "model, num",
     [
@@ -891,6 +1003,18 @@ def test_find_reactions_with_partially_identical_annotations(model, num):
     assert total == num
 
 
+@pytest.mark.parametrize("model", ["dup_rxns_overlapping_anns"], indirect=["model"])
+def test_find_reactions_with_partially_identical_annotations_groups(model):
+    """Expect reactions to be grouped by every set of shared annotations."""
+    duplicates, total = basic.find_reactions_with_partially_identical_annotations(model)
+    assert list(duplicates.items()) == [
+        ("kegg.reaction:HEX", ["rxn1", "rxn2", "rxn3"]),
+        ("kegg.reaction:HEX,metanetx.reaction:MNXR1", ["rxn1", "rxn3"]),
+        ("rhea:1,rhea:2", ["rxn4", "rxn5"]),
+    ]
+    assert total == 5
+
+
 @pytest.mark.parametrize(
     "model, expected",
     [
@@ -909,6 +1033,14 @@ def test_find_duplicate_reactions(model, expected):
     assert num == expected
 
 
+@pytest.mark.parametrize("model", ["dup_rxns_multiple_groups"], indirect=["model"])
+def test_find_duplicate_reactions_pairs(model):
+    """Expect all pairs of duplicate reactions in model order."""
+    duplicates, num = basic.find_duplicate_reactions(model)
+    assert duplicates == [("rxn1", "dup1"), ("rxn1", "dup2"), ("dup1", "dup2")]
+    assert num == 3
+
+
 @pytest.mark.parametrize(
     "model, num",
     [("empty", 0), ("identical_genes", 2), ("different_genes", 0), ("gpr_missing", 0)],
@@ -920,6 +1052,17 @@ def test_find_reactions_with_identical_genes(model, num):
     assert total == num
 
 
+@pytest.mark.parametrize("model", ["identical_genes_groups"], indirect=["model"])
+def test_find_reactions_with_identical_genes_groups(model):
+    """Expect reactions to be grouped by their genes in model order."""
+    duplicates, total = basic.find_reactions_with_identical_genes(model)
+    assert list(duplicates.items()) == [
+        ("gene1,gene2", ["RXN1", "RXN3"]),
+        ("gene3", ["RXN2", "RXN4"]),
+    ]
+    assert total == 4
+
+
 @pytest.mark.parametrize("model, num", [("transport_gpr", 1)], indirect=["model"])
 def test_check_transport_reaction_gpr_presence(model, num):
     """Expect amount of transport reactions without gpr to be identified."""
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.support.cache``."""
+
+from __future__ import absolute_import
+
+import multiprocessing
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from cobra import Metabolite, Reaction
+
+import memote.support.thermodynamics as thermo
+from memote.support.cache import (
+    MODEL_CACHE,
+    DiskCache,
+    ModelCache,
+    model_cache,
+    model_version,
+)
+
+
+# Standard Gibbs energies of formation of a stand-in for the eQuilibrator
+# backend. Compounds without a value cannot be decomposed.
+FORMATION_ENERGIES = {
+    "C00001": -157.6,
+    "C00009": -1059.5,
+    "C00267": -426.7,
+    "C00668": -1318.9,
+    "C15672": None,
+}
+
+
+class FakeCompound(object):
+    """Stand in for an eQuilibrator compound."""
+
+    def __init__(self, kegg_id):
+        self.kegg_id = kegg_id
+
+    def dG0_prime(self, pH, pMg, ionic_strength):
+        return FORMATION_ENERGIES[self.kegg_id]
+
+
+class FakeReaction(object):
+    """Stand in for an eQuilibrator reaction that counts its instances."""
+
+    instances = 0
+
+    def __init__(self, stoichiometry, rxn_id):
+        FakeReaction.instances += 1
+        if not set(stoichiometry).issubset(FORMATION_ENERGIES):
+            raise KeyError(rxn_id)
+        self.rxn_id = rxn_id
+        self.stoichiometry = stoichiometry
+        self.kegg_ids = list(stoichiometry)
+
+    def check_full_reaction_balancing(self):
+        return not self.rxn_id.startswith("unbalanced")
+
+    def get_compound(self, kegg_id):
+        return FakeCompound(kegg_id)
+
+    def get_coeff(self, kegg_id):
+        return self.stoichiometry[kegg_id]
+
+    def reversibility_index(self):
+        rt = thermo._settings.RT
+        d_g0 = sum(
+            coef * FORMATION_ENERGIES[kegg_id]
+            for kegg_id, coef in self.stoichiometry.items()
+        )
+        # Water does not count towards the coefficient sums.
+        coefficients = [
+            coef for kegg_id, coef in self.stoichiometry.items() if kegg_id != "C00001"
+        ]
+        d_gm = d_g0 + rt * sum(coefficients) * np.log(1e-3)
+        return 2.0 / sum(map(abs, coefficients)) * d_gm / rt
+
+
+@pytest.fixture(scope="function")
+def equilibrator(monkeypatch):
+    """Replace the eQuilibrator backend of the thermodynamics module."""
+    settings = SimpleNamespace(
+        DEFAULT_PH=7.0,
+        DEFAULT_PMG=14.0,
+        DEFAULT_IONIC_STRENGTH=0.1,
+        DEFAULT_TEMP=298.15,
+        RT=8.31e-3 * 298.15,
+    )
+    monkeypatch.setattr(thermo, "_Reaction", FakeReaction)
+    monkeypatch.setattr(thermo, "_settings", settings)
+    monkeypatch.setattr(thermo, "_equilibrator_version", lambda: "0.1.8")
+    monkeypatch.setattr(thermo, "_equilibrator_checked", True)
+    FakeReaction.instances = 0
+    return settings
+
+
+def kegg_reaction(rxn_id, stoichiometry):
+    """Return a reaction whose metabolites are annotated with KEGG IDs."""
+    rxn = Reaction(rxn_id)
+    metabolites = {}
+    for kegg_id, coef in stoichiometry.items():
+        met = Metabolite("{}_c".format(kegg_id), compartment="c")
+        met.annotation["kegg.compound"] = kegg_id
+        metabolites[met] = coef
+    rxn.add_metabolites(metabolites)
+    return rxn
+
+
+@pytest.mark.parametrize("model", ["empty"], indirect=["model"])
+def test_model_version(model):
+    """Expect the version to track structural and bound changes."""
+    rxn = Reaction("R1", lower_bound=0, upper_bound=1000)
+    rxn.add_metabolites({Metabolite("a", compartment="c"): -1})
+    model.add_reactions([rxn])
+    before = model_version(model)
+    assert model_version(model) == before
+    with model:
+        rxn.upper_bound = 10
+        assert model_version(model) != before
+    assert model_version(model) == before
+    rxn.add_metabolites({Metabolite("b", compartment="c"): 1})
+    assert model_version(model) != before
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda m: m.reactions.PGI.add_metabolites({m.metabolites.g6p_c: -1}),
+        lambda m: setattr(m.reactions.PGI, "gene_reaction_rule", "b4025 or b0001"),
+        lambda m: m.reactions.PGI.annotation.update({"sbo": "SBO:0000176"}),
+        lambda m: setattr(m.metabolites.g6p_c, "formula", "C6H12O9P"),
+        lambda m: setattr(
+            m.metabolites.g6p_c, "charge", m.metabolites.g6p_c.charge + 1
+        ),
+        lambda m: m.metabolites.g6p_c.annotation.update({"kegg.compound": "C99999"}),
+        lambda m: setattr(m.genes.b4025, "name", "pgi"),
+        lambda m: setattr(m, "objective", "ATPM"),
+        lambda m: setattr(m, "objective_direction", "min"),
+    ],
+)
+def test_model_version_in_place(model, modify):
+    """Expect the version to track in-place changes of the model's attributes."""
+    before = model_version(model)
+    modify(model)
+    assert model_version(model) != before
+
+
+@pytest.mark.parametrize("model", ["empty"], indirect=["model"])
+def test_model_cache(model):
+    """Expect results to be reused only for the same model state."""
+    cache = ModelCache(max_versions=2)
+    rxn = Reaction("R1", lower_bound=0, upper_bound=1000)
+    rxn.add_metabolites({Metabolite("a", compartment="c"): -1})
+    model.add_reactions([rxn])
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return len(calls)
+
+    assert cache.get(model, "key", compute) == 1
+    assert cache.get(model, "key", compute) == 1
+    with model:
+        rxn.lower_bound = -1000
+        assert cache.get(model, "key", compute) == 2
+    assert cache.get(model, "key", compute) == 1
+    assert cache.info() == (2, 2, 1, 2)
+    cache.evict(model)
+    assert cache.get(model, "key", compute) == 3
+    assert cache.info().models == 1
+
+
+@pytest.mark.parametrize("model", ["empty"], indirect=["model"])
+def test_model_cache_keyword_arguments(model):
+    """Expect keyword arguments to be passed on but not to be part of the key."""
+    calls = []
+
+    @model_cache
+    def compute(model, value, processes=1):
+        calls.append(processes)
+        return value
+
+    MODEL_CACHE.evict(model)
+    assert compute(model, 1, processes=2) == 1
+    assert compute(model, 1, processes=3) == 1
+    assert compute(model, 2, processes=3) == 2
+    assert calls == [2, 3]
+    MODEL_CACHE.evict(model)
+
+
+def test_disk_cache(tmp_path):
+    """Expect stored values to persist across connections."""
+    path = str(tmp_path / "sub" / "cache.sqlite")
+    with DiskCache(path) as cache:
+        assert cache.get_many(["a"]) == {}
+        cache.set_many({"a": 1.5, "b": [1, "x"]})
+        cache.set_many({"a": -2.0})
+    with DiskCache(path) as cache:
+        keys = ["a", "b", "c"] + [str(i) for i in range(1000)]
+        assert cache.get_many(keys) == {"a": -2.0, "b": [1, "x"]}
+
+
+@pytest.mark.parametrize(
+    "stoichiometry, expected",
+    [
+        ({}, ""),
+        ({"C00267": 1, "C00668": -1}, "C00267:1.0 C00668:-1.0"),
+        ({"C00668": -1.0, "C00267": 1}, "C00267:1.0 C00668:-1.0"),
+        ({"C00001": 0.5}, "C00001:0.5"),
+    ],
+)
+def test_stoichiometry_key(stoichiometry, expected):
+    """Expect equal stoichiometries to have the same canonical key."""
+    assert thermo.stoichiometry_key(stoichiometry) == expected
+
+
+def test_reversibility_index_disk_cache(tmp_path, equilibrator, monkeypatch):
+    """Expect cached indexes to be reused only under the same conditions."""
+    reactions = [
+        kegg_reaction("G6PP", {"C00668": -1, "C00001": -1, "C00267": 1, "C00009": 1}),
+        kegg_reaction("PP", {"C00009": -1, "C00001": 1}),
+    ]
+    path = str(tmp_path / "cache.sqlite")
+    with DiskCache(path) as cache:
+        expected = thermo.find_thermodynamic_reversibility_index(
+            reactions, cache=cache, processes=1
+        )
+        assert FakeReaction.instances == 2
+        assert len(expected[0]) == 2
+    with DiskCache(path) as cache:
+        result = thermo.find_thermodynamic_reversibility_index(
+            reactions, cache=cache, processes=1
+        )
+        assert FakeReaction.instances == 2
+        assert result == expected
+        # Other conditions or another eQuilibrator version invalidate entries.
+        monkeypatch.setattr(equilibrator, "DEFAULT_PH", 7.5)
+        thermo.find_thermodynamic_reversibility_index(
+            reactions, cache=cache, processes=1
+        )
+        assert FakeReaction.instances == 4
+        monkeypatch.setattr(thermo, "_equilibrator_version", lambda: "0.2.0")
+        thermo.find_thermodynamic_reversibility_index(
+            reactions, cache=cache, processes=1
+        )
+        assert FakeReaction.instances == 6
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="Worker processes only inherit the stand-in backend when forked.",
+)
+def test_reversibility_index_parallel(tmp_path, equilibrator):
+    """Expect parallel and cached results in the order of the serial ones."""
+    reactions = [
+        kegg_reaction("G6PP", {"C00668": -1, "C00001": -1, "C00267": 1, "C00009": 1}),
+        kegg_reaction("PP", {"C00009": -1, "C00001": 1}),
+        kegg_reaction("incomplete", {"C00009": -1, "C00002": 1}),
+        kegg_reaction("unbalanced", {"C00668": -1, "C00267": 1}),
+        kegg_reaction("problematic", {"C15672": -1, "C00267": 1}),
+        kegg_reaction("G6P", {"C00267": -1, "C00009": -1, "C00668": 1}),
+    ]
+    expected = thermo.find_thermodynamic_reversibility_index(
+        reactions, cache=False, processes=1
+    )
+    assert tuple(map(len, expected)) == (3, 1, 1, 1)
+    with DiskCache(str(tmp_path / "cache.sqlite")) as cache:
+        for _ in range(2):
+            result = thermo.find_thermodynamic_reversibility_index(
+                reactions, cache=cache, processes=2
+            )
+            assert result == expected
+
+
+def test_compute_reversibility_indexes(equilibrator):
+    """Expect the batched indexes to follow from the formation energies."""
+    batch = [
+        ({"C00668": -1, "C00001": -1, "C00267": 1, "C00009": 1}, "G6PP"),
+        ({"C00009": -1, "C00002": 1}, "incomplete"),
+        ({"C00668": -1, "C00267": 1}, "unbalanced"),
+        ({"C15672": -1, "C00267": 1}, "problematic"),
+        ({"C00001": 1}, "water"),
+        ({"C00267": -1, "C00009": -1, "C00668": 1}, "G6P"),
+    ]
+    outcomes = thermo._compute_reversibility_indexes(batch)
+    assert [outcome for outcome, _ in outcomes] == [
+        "index",
+        "incomplete",
+        "unbalanced",
+        "problematic",
+        "index",
+        "index",
+    ]
+    for i in (0, 5):
+        expected = FakeReaction(*batch[i]).reversibility_index()
+        assert outcomes[i][1] == pytest.approx(expected)
+    assert outcomes[4][1] == np.inf
+
+
+def test_check_equilibrator(equilibrator, monkeypatch):
+    """Expect an error if eQuilibrator computes a different index."""
+    monkeypatch.setattr(thermo, "_equilibrator_checked", False)
+    thermo._check_equilibrator()
+    assert thermo._equilibrator_checked
+    monkeypatch.setattr(thermo, "_equilibrator_checked", False)
+    monkeypatch.setattr(FakeReaction, "reversibility_index", lambda self: 0.0)
+    with pytest.raises(RuntimeError, match="0.1.8"):
+        thermo._check_equilibrator()
+    assert not thermo._equilibrator_checked
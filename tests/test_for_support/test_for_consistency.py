@@ -629,6 +629,32 @@ def test_find_inconsistent_min_stoichiometry(model, inconsistent):
         assert tuple(met.id for met in unconserved) in set(inconsistent)
 
 
+@pytest.mark.parametrize("max_mets_computed", [10, 1])
+@pytest.mark.parametrize(
+    "model", ["figure_1", "equation_8", "figure_2"], indirect=["model"]
+)
+def test_parallel_find_inconsistent_min_stoichiometry(model, max_mets_computed):
+    """Expect the same minimal sets from multiple processes."""
+    serial = consistency.find_inconsistent_min_stoichiometry(
+        model, max_mets_computed=max_mets_computed, processes=1
+    )
+    parallel = consistency.find_inconsistent_min_stoichiometry(
+        model, max_mets_computed=max_mets_computed, processes=2
+    )
+    assert {tuple(m.id for m in mets) for mets in parallel} == {
+        tuple(m.id for m in mets) for mets in serial
+    }
+
+
+@pytest.mark.parametrize("model", ["figure_1"], indirect=["model"])
+def test_find_inconsistent_min_stoichiometry_time_limit(model):
+    """Expect no minimal sets to be computed without any time left."""
+    unconserved_sets = consistency.find_inconsistent_min_stoichiometry(
+        model, max_mets_computed=None, time_limit=0, processes=1
+    )
+    assert unconserved_sets == set()
+
+
 @pytest.mark.parametrize(
     "model, metabolite_id",
     [
@@ -663,6 +689,30 @@ def test_detect_energy_generating_cycles_exceptions(model, metabolite_id, output
     assert set(result) == set(output)
 
 
+@pytest.mark.parametrize(
+    "model",
+    [
+        "produces_atp",
+        "produces_accoa",
+        "produces_fadh2",
+        "produces_glu",
+        "produces_nadh",
+        "maintenance_present",
+        "no_atp",
+        "infeasible",
+    ],
+    indirect=["model"],
+)
+def test_detect_all_energy_generating_cycles(model):
+    """Expect the same cycles as when detecting them one metabolite at a time."""
+    cycles = consistency.detect_all_energy_generating_cycles(model)
+    assert len(cycles) > 0
+    for metabolite_id, cycle in cycles.items():
+        with model:
+            expected = consistency.detect_energy_generating_cycles(model, metabolite_id)
+        assert set(cycle) == set(expected)
+
+
 @pytest.mark.parametrize(
     "model, num",
     [
@@ -699,6 +749,65 @@ def test_find_mass_unbalanced_reactions(model, num):
     assert len(reactions) == num
 
 
+@pytest.mark.parametrize(
+    "model, imbalance",
+    [
+        ("all_balanced", {"C": 0.0, "H": 0.0}),
+        ("mass_unbalanced", {"C": 1.0, "S": 1.0}),
+        ("charge_unbalanced", {"C": 0.0, "N": 0.0}),
+    ],
+    indirect=["model"],
+)
+def test_find_mass_imbalance(model, imbalance):
+    """Expect the net amount of each element produced by a reaction."""
+    result = consistency.find_mass_imbalance(model.reactions)
+    assert list(result.columns) == sorted(result.columns)
+    for element, amount in imbalance.items():
+        assert result.at["RA1", element] == amount
+
+
+@pytest.mark.parametrize("model", ["met_no_formula"], indirect=["model"])
+def test_find_mass_imbalance_unknown(model):
+    """Expect an unknown imbalance for metabolites without formula."""
+    assert consistency.find_mass_imbalance(model.reactions).loc["RA1"].isnull().all()
+
+
+@pytest.mark.parametrize(
+    "model, charge",
+    [
+        ("all_balanced", 0.0),
+        ("charge_unbalanced", -1.0),
+        ("met_no_charge", None),
+    ],
+    indirect=["model"],
+)
+def test_find_charge_imbalance(model, charge):
+    """Expect the net charge produced by a reaction."""
+    result = consistency.find_charge_imbalance(model.reactions)
+    if charge is None:
+        assert result.isnull()["RA1"]
+    else:
+        assert result["RA1"] == charge
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        "blocked_reactions",
+        "gap_model",
+        "gap_model_2",
+        "gapfilled_model",
+        "textbook",
+    ],
+    indirect=["model"],
+)
+def test_find_universally_blocked_reactions(model):
+    """Expect the same blocked reactions as with flux variability analysis."""
+    blocked = consistency.find_universally_blocked_reactions(model)
+    expected = cobra.flux_analysis.find_blocked_reactions(model, open_exchanges=True)
+    assert set(blocked) == set(expected)
+
+
 @pytest.mark.parametrize(
     "model, num",
     [
@@ -824,6 +933,41 @@ def test_parallel_find_metabolites_not_consumed_with_open_bounds(model, num):
     assert badmets == multi_badmets
 
 
+@pytest.mark.parametrize("coefficient", [-1, 1])
+@pytest.mark.parametrize(
+    "model",
+    ["gap_model", "gap_model_2", "gapfilled_model", "textbook"],
+    indirect=["model"],
+)
+def test_pruned_find_blocked_metabolites(model, coefficient):
+    """Expect pruning to yield exactly the same blocked metabolites."""
+    assert consistency.find_blocked_metabolites(
+        model, coefficient, processes=1, prune=True
+    ) == consistency.find_blocked_metabolites(model, coefficient, processes=1)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+@pytest.mark.parametrize("model", ["gap_model", "gap_model_2"], indirect=["model"])
+def test_metabolite_exchange_pool(model, processes):
+    """Expect a persistent pool to reproduce the one-off results."""
+    not_produced = consistency.find_metabolites_not_produced_with_open_bounds(model)
+    not_consumed = consistency.find_metabolites_not_consumed_with_open_bounds(model)
+    with consistency.MetaboliteExchangePool(model, processes=processes) as pool:
+        for _ in range(2):
+            assert (
+                consistency.find_metabolites_not_produced_with_open_bounds(
+                    model, pool=pool
+                )
+                == not_produced
+            )
+            assert (
+                consistency.find_metabolites_not_consumed_with_open_bounds(
+                    model, pool=pool
+                )
+                == not_consumed
+            )
+
+
 @pytest.mark.parametrize(
     "model, fraction",
     [
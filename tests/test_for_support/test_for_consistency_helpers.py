@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.support.consistency_helpers``."""
+
+from __future__ import absolute_import
+
+import numpy as np
+import pytest
+from cobra import Metabolite, Reaction
+
+import memote.support.consistency_helpers as con_helpers
+from memote.utils import register_with
+
+
+MODEL_REGISTRY = dict()
+
+
+@register_with(MODEL_REGISTRY)
+def x2_cycle_open(base):
+    x1 = Metabolite("x1")
+    x2 = Metabolite("x2")
+    x3 = Metabolite("x3")
+    x4 = Metabolite("x4")
+    x5 = Metabolite("x5")
+    rxn_1 = Reaction("R1", lower_bound=-1000, upper_bound=1000)
+    rxn_1.add_metabolites({x1: -1, x2: -1, x3: 1})
+    rxn_2 = Reaction("R2", lower_bound=-1000, upper_bound=1000)
+    rxn_2.add_metabolites({x3: -1, x4: 1})
+    rxn_3 = Reaction("R3", lower_bound=-1000, upper_bound=1000)
+    rxn_3.add_metabolites({x4: -1, x5: 1, x2: 1})
+    rxn_b1 = Reaction("B1", lower_bound=0, upper_bound=1000)
+    rxn_b1.add_metabolites({x1: 1})
+    rxn_b2 = Reaction("B2", lower_bound=0, upper_bound=1000)
+    rxn_b2.add_metabolites({x5: -1})
+    base.add_reactions([rxn_1, rxn_2, rxn_3, rxn_b1, rxn_b2])
+    return base
+
+
+@pytest.mark.parametrize("model", ["x2_cycle_open", "textbook"], indirect=["model"])
+def test_stoichiometry_matrix(model):
+    matrix, met_index, rxn_index = con_helpers.stoichiometry_matrix(
+        model.metabolites, model.reactions
+    )
+    assert matrix.shape == (len(model.metabolites), len(model.reactions))
+    for rxn in model.reactions:
+        for met, coef in rxn.metabolites.items():
+            assert matrix[met_index[met], rxn_index[rxn]] == coef
+    assert np.count_nonzero(matrix) == sum(len(r.metabolites) for r in model.reactions)
+
+
+@pytest.mark.parametrize("model", ["x2_cycle_open", "textbook"], indirect=["model"])
+@pytest.mark.parametrize("fmt", ["csc", "csr", "coo"])
+def test_sparse_stoichiometry_matrix(model, fmt):
+    dense, _, _ = con_helpers.stoichiometry_matrix(model.metabolites, model.reactions)
+    matrix, met_index, rxn_index = con_helpers.sparse_stoichiometry_matrix(
+        model.metabolites, model.reactions, fmt=fmt
+    )
+    assert matrix.format == fmt
+    assert matrix.nnz == sum(len(r.metabolites) for r in model.reactions)
+    assert np.array_equal(matrix.toarray(), dense)
+    assert [met_index[m] for m in model.metabolites] == list(range(len(met_index)))
+    assert [rxn_index[r] for r in model.reactions] == list(range(len(rxn_index)))
+
+
+@pytest.mark.parametrize("model", ["x2_cycle_open", "textbook"], indirect=["model"])
+def test_rank_nullspace_sparse_input(model):
+    matrix, _, _ = con_helpers.sparse_stoichiometry_matrix(
+        model.metabolites, model.reactions
+    )
+    dense = matrix.toarray()
+    assert con_helpers.rank(matrix) == con_helpers.rank(dense)
+    assert np.array_equal(con_helpers.nullspace(matrix), con_helpers.nullspace(dense))
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_flux_variability(model):
+    """Expect the flux ranges to respect the reaction bounds."""
+    with model:
+        model.reactions.EX_glc__D_e.lower_bound = -5
+        fva_result = con_helpers.flux_variability(model, fraction_of_optimum=0.9)
+    assert (fva_result["maximum"] >= fva_result["minimum"]).all()
+    assert fva_result.at["EX_glc__D_e", "minimum"] >= -5
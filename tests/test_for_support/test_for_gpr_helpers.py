@@ -21,7 +21,7 @@ from __future__ import absolute_import
 
 import pytest
 
-from memote.support.gpr_helpers import find_top_level_complex
+from memote.support.gpr_helpers import compile_gpr, find_top_level_complex
 
 
 @pytest.mark.parametrize(
@@ -31,3 +31,36 @@ from memote.support.gpr_helpers import find_top_level_complex
 def test_find_functional_units(gpr, expected):
     """Expect the size of the unique elements in a complex to be correct."""
     assert find_top_level_complex(gpr) == expected
+
+
+@pytest.mark.parametrize(
+    "gpr, genes, expected",
+    [
+        ("", set(), 0),
+        ("gene1 and gene2", {"gene1", "gene2"}, 2),
+        ("1234.1 AND (5678.1 || 91011.2)", {"1234.1", "5678.1", "91011.2"}, 3),
+        ("b0001-a & b0001.a", {"b0001-a", "b0001.a"}, 2),
+    ],
+)
+def test_compile_gpr(gpr, genes, expected):
+    """Expect the genes and the complex size to be found."""
+    compiled = compile_gpr(gpr)
+    assert compiled.genes == genes
+    assert compiled.complex_size == expected
+    assert compile_gpr(gpr) is compiled
+
+
+@pytest.mark.parametrize(
+    "knockouts, expected",
+    [
+        (set(), True),
+        ({"gene1"}, False),
+        ({"gene2"}, True),
+        ({"gene2", "gene3"}, False),
+        ({"gene4"}, True),
+    ],
+)
+def test_compiled_gpr_is_functional(knockouts, expected):
+    """Expect the association to be evaluated under gene knockouts."""
+    compiled = compile_gpr("gene1 and (gene2 or gene3)")
+    assert compiled.is_functional(knockouts) == expected
@@ -597,6 +597,37 @@ def test_find_met_in_model_accurate_results(model, mnx_id, compartment_id, expec
     assert met[0].id == expected
 
 
+@pytest.mark.parametrize("model", ["find_met_id"], indirect=["model"])
+def test_find_mets_in_model(model):
+    """Expect several metabolites to be found at once."""
+    mets = helpers.find_mets_in_model(model, ["MNXM3", "MNXM7", "MNXM1"], "c")
+    assert [m[0].id for m in mets] == ["atp_c", "OVER9000_c0", "x12"]
+
+
+def test_get_metanetx_shortlist():
+    """Expect the shortlist to be read once and without empty namespaces."""
+    shortlist = helpers.get_metanetx_shortlist()
+    assert helpers.get_metanetx_shortlist() is shortlist
+    assert shortlist["MNXM3"]["mnx"] == ["MNXM3"]
+    assert all(len(xrefs) > 0 for xrefs in shortlist["MNXM3"].values())
+    assert "MNXM3" in helpers.METANETX_SHORTLIST.columns
+
+
+@pytest.mark.parametrize("model", ["find_met_id"], indirect=["model"])
+def test_find_met_in_model_index_update(model):
+    """Expect the metabolite index to follow changes to the metabolites."""
+    assert len(helpers.find_met_in_model(model, "MNXM3")) == 1
+    with model:
+        model.add_metabolites([cobra.Metabolite("atp_e", compartment="e")])
+        assert helpers.find_met_in_model(model, "MNXM3", "e")[0].id == "atp_e"
+    assert len(helpers.find_met_in_model(model, "MNXM3")) == 1
+    met = cobra.Metabolite("x13", compartment="p")
+    model.add_metabolites([met])
+    assert met not in helpers.find_met_in_model(model, "MNXM3")
+    met.annotation["seed.compound"] = "cpd00002"
+    assert met in helpers.find_met_in_model(model, "MNXM3")
+
+
 @pytest.mark.parametrize(
     "model, mnx_id, compartment_id",
     [
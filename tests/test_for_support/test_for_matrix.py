@@ -153,3 +153,21 @@ def test_matrix_rank(model, num):
 )
 def test_degrees_of_freedom(model, num):
     assert matrix.degrees_of_freedom(model) == num
+
+
+@pytest.mark.parametrize("model", ["x2_cycle_closed"], indirect=["model"])
+def test_stoichiometric_decomposition_cache(model):
+    decomposition = matrix.stoichiometric_decomposition(model)
+    assert decomposition == (5, 3, 3)
+    assert matrix.stoichiometric_decomposition(model) is decomposition
+    with model:
+        rxn = Reaction("B1", lower_bound=0, upper_bound=1000)
+        rxn.add_metabolites({model.metabolites.x1: 1})
+        model.add_reactions([rxn])
+        assert matrix.stoichiometric_decomposition(model) == (5, 4, 4)
+        with model:
+            rxn.add_metabolites({model.metabolites.x5: -1})
+            # The boundary reaction now reverses the net conversion x1 -> x5.
+            assert matrix.matrix_rank(model) == 3
+            assert matrix.degrees_of_freedom(model) == 1
+    assert matrix.stoichiometric_decomposition(model) is decomposition
@@ -29,6 +29,7 @@ pytest.skip(
 )
 
 import memote.support.thermodynamics as thermo
+from memote.support.cache import DiskCache
 from memote.utils import register_with
 
 
@@ -239,3 +240,32 @@ def test_find_incorrect_thermodynamic_reversibility(reaction, expected):
     """Expect the correct reversibility information."""
     result = tuple(map(len, thermo.find_thermodynamic_reversibility_index([reaction])))
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "reaction", ["direct_annotation", "direct_annotation_correct_rev"], indirect=True
+)
+def test_find_thermodynamic_reversibility_index_batched(reaction):
+    """Expect the batched index to equal eQuilibrator's per-reaction index."""
+    from equilibrator_api import Reaction
+
+    stoichiometry = thermo.translate_reaction(reaction, {})
+    expected = Reaction(stoichiometry, reaction.id).reversibility_index()
+    ((_, ln_gamma),) = thermo.find_thermodynamic_reversibility_index(
+        [reaction], cache=False
+    )[0]
+    assert ln_gamma == pytest.approx(expected)
+
+
+def test_find_thermodynamic_reversibility_index_parallel(tmp_path):
+    """Expect parallel and cached results in the order of the serial ones."""
+    reactions = [func() for func in REACTION_REGISTRY.values()]
+    expected = thermo.find_thermodynamic_reversibility_index(
+        reactions, cache=False, processes=1
+    )
+    with DiskCache(str(tmp_path / "cache.sqlite")) as cache:
+        for _ in range(2):
+            result = thermo.find_thermodynamic_reversibility_index(
+                reactions, cache=cache, processes=2
+            )
+            assert result == expected